@@ -7,28 +7,44 @@ Command-line interface for running and managing benchmark tasks.
 
 import argparse
 import json
+import os
 import sys
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional
 
-from benchmark_tasks.task_loader import TaskLoader, BenchmarkTask
+from benchmark_tasks.task_loader import TaskLoader, BenchmarkTask, iter_task_files
 from benchmark_tasks.task_runner import TaskRunner, TaskResult
 
+# Indicator lookup bins: the first entry whose threshold bounds the value
+# wins, so the chained ternaries stay out of the per-result hot path. Bins
+# marked strict exclude their threshold: matching a human baseline exactly
+# (1.0x speed) is on-par, not faster
+_SPEED_BINS = ((1.0, True, "🚀"), (1.5, False, "⚡"), (float("inf"), False, "🐌"))
+_EFFICIENCY_BINS = ((1.1, False, "🎯"), (float("inf"), False, "📈"))
+_SCORE_BINS = ((0.7, False, "📉"), (0.9, False, "🥉"), (float("inf"), False, "🏆"))
+
+
+def _indicator(value: float, bins) -> str:
+    """Return the indicator for the first bin whose threshold bounds value"""
+    return next(
+        symbol for threshold, strict, symbol in bins
+        if (value < threshold if strict else value <= threshold)
+    )
+
 
 def list_tasks(loader: TaskLoader, category: Optional[str] = None, complexity: Optional[str] = None):
     """List available tasks"""
-    tasks = loader.load_all_tasks()
-    
-    if category:
-        tasks = [t for t in tasks if t.category == category]
-    
-    if complexity:
-        tasks = [t for t in tasks if t.complexity == complexity]
-    
+    tasks = [
+        t for t in loader.tasks
+        if (not category or t.category == category)
+        and (not complexity or t.complexity == complexity)
+    ]
+
     print(f"\nFound {len(tasks)} tasks:")
     print("-" * 80)
     
-    for task in sorted(tasks, key=lambda t: (t.category, t.complexity, t.task_id)):
+    for task in sorted(tasks, key=attrgetter('category', 'complexity', 'task_id')):
         print(f"{task.task_id:30} | {task.category:15} | {task.complexity:10} | {task.name}")
 
 
@@ -36,9 +52,8 @@ def run_single_task(loader: TaskLoader, runner: TaskRunner, task_id: str):
     """Run a single task by ID"""
     try:
         # Find task by ID
-        all_tasks = loader.load_all_tasks()
-        task = next((t for t in all_tasks if t.task_id == task_id), None)
-        
+        task = loader.get_task(task_id)
+
         if not task:
             print(f"Error: Task '{task_id}' not found")
             return False
@@ -62,86 +77,89 @@ def run_single_task(loader: TaskLoader, runner: TaskRunner, task_id: str):
 
 def run_task_suite(loader: TaskLoader, runner: TaskRunner, category: Optional[str] = None, complexity: Optional[str] = None):
     """Run a suite of tasks"""
-    tasks = loader.load_all_tasks()
-    
-    if category:
-        tasks = [t for t in tasks if t.category == category]
-    
-    if complexity:
-        tasks = [t for t in tasks if t.complexity == complexity]
-    
+    tasks = [
+        t for t in loader.tasks
+        if (not category or t.category == category)
+        and (not complexity or t.complexity == complexity)
+    ]
+
     if not tasks:
         print("No tasks found matching criteria")
         return
     
     print(f"\nRunning {len(tasks)} tasks...")
     print("=" * 80)
-    
-    results = runner.run_task_suite(tasks)
-    
+
+    # Stream results as tasks complete instead of materializing the full
+    # list before any output
+    total = 0
+    successful = 0
+    for i, (task, result) in enumerate(runner.run_task_suite_iter(tasks), 1):
+        total += 1
+        successful += result.success
+        print(f"\n{i}. {task.name}")
+        print_task_result(result, task)
+
     # Print summary
     print("\n" + "=" * 80)
     print("BENCHMARK RESULTS SUMMARY")
     print("=" * 80)
-    
-    successful = sum(1 for r in results if r.success)
-    print(f"Tasks completed: {len(results)}")
+
+    print(f"Tasks completed: {total}")
     print(f"Successful: {successful}")
-    print(f"Failed: {len(results) - successful}")
-    print(f"Success rate: {successful / len(results) * 100:.1f}%")
-    
-    # Print detailed results
-    print("\nDetailed Results:")
-    print("-" * 80)
-    
-    for i, result in enumerate(results, 1):
-        task = tasks[i-1]  # Corresponding task
-        print(f"\n{i}. {task.name}")
-        print_task_result(result, task)
+    print(f"Failed: {total - successful}")
+    print(f"Success rate: {successful / total * 100:.1f}%" if total else "Success rate: n/a")
 
 
 def print_task_result(result: TaskResult, task: BenchmarkTask):
     """Print formatted task result"""
     status = "✅ PASS" if result.success else "❌ FAIL"
-    
-    print(f"   Status: {status}")
-    print(f"   Execution time: {result.execution_time_seconds:.2f}s")
-    
+
+    # Build the report in memory and emit it in one write rather than
+    # lock/flush stdout per field
+    lines = [
+        f"   Status: {status}",
+        f"   Execution time: {result.execution_time_seconds:.2f}s",
+    ]
+
     if result.speed_vs_human_baseline:
-        speed_indicator = "🚀" if result.speed_vs_human_baseline < 1.0 else "🐌" if result.speed_vs_human_baseline > 1.5 else "⚡"
-        print(f"   Speed vs human: {result.speed_vs_human_baseline:.2f}x {speed_indicator}")
-    
+        speed_indicator = _indicator(result.speed_vs_human_baseline, _SPEED_BINS)
+        lines.append(f"   Speed vs human: {result.speed_vs_human_baseline:.2f}x {speed_indicator}")
+
     if result.action_count_vs_baseline:
-        efficiency_indicator = "🎯" if result.action_count_vs_baseline <= 1.1 else "📈"
-        print(f"   Action efficiency: {result.action_count_vs_baseline:.2f}x {efficiency_indicator}")
-    
+        efficiency_indicator = _indicator(result.action_count_vs_baseline, _EFFICIENCY_BINS)
+        lines.append(f"   Action efficiency: {result.action_count_vs_baseline:.2f}x {efficiency_indicator}")
+
     if result.overall_score:
-        score_indicator = "🏆" if result.overall_score > 0.9 else "🥉" if result.overall_score > 0.7 else "📉"
-        print(f"   Overall score: {result.overall_score:.2f} {score_indicator}")
-    
+        score_indicator = _indicator(result.overall_score, _SCORE_BINS)
+        lines.append(f"   Overall score: {result.overall_score:.2f} {score_indicator}")
+
     if result.error_message:
-        print(f"   Error: {result.error_message}")
+        lines.append(f"   Error: {result.error_message}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def validate_tasks(loader: TaskLoader):
     """Validate all task definitions"""
     tasks_dir = loader.tasks_directory
-    json_files = list(tasks_dir.rglob("*.json"))
-    json_files = [f for f in json_files if f.name != "task_schema.json"]
-    
+    json_files = list(iter_task_files(tasks_dir))
+
     print(f"\nValidating {len(json_files)} task files...")
     print("-" * 60)
-    
+
     valid_count = 0
     invalid_count = 0
-    
+
+    prefix = str(tasks_dir) + os.sep
     for task_file in json_files:
+        rel_path = task_file.removeprefix(prefix)
         try:
             task = loader.load_task(task_file)
-            print(f"✅ {task_file.relative_to(tasks_dir)}: {task.name}")
+            print(f"✅ {rel_path}: {task.name}")
             valid_count += 1
         except Exception as e:
-            print(f"❌ {task_file.relative_to(tasks_dir)}: {str(e)}")
+            print(f"❌ {rel_path}: {str(e)}")
             invalid_count += 1
     
     print(f"\nValidation complete: {valid_count} valid, {invalid_count} invalid")
@@ -209,26 +227,29 @@ def main():
             sys.exit(0 if success else 1)
         
         elif args.command == "info":
-            all_tasks = loader.load_all_tasks()
-            task = next((t for t in all_tasks if t.task_id == args.task_id), None)
+            task = loader.get_task(args.task_id)
             if task:
-                print(f"\nTask: {task.name}")
-                print(f"ID: {task.task_id}")
-                print(f"Category: {task.category}")
-                print(f"Complexity: {task.complexity}")
-                print(f"Description: {task.description}")
-                print(f"Tags: {', '.join(task.tags)}")
-                print(f"Timeout: {task.timeout_seconds}s")
-                print(f"Human baseline: {task.human_baseline.median_time_seconds}s, {task.human_baseline.median_action_count} actions, {task.human_baseline.success_rate:.0%} success")
-                
+                lines = [
+                    f"\nTask: {task.name}",
+                    f"ID: {task.task_id}",
+                    f"Category: {task.category}",
+                    f"Complexity: {task.complexity}",
+                    f"Description: {task.description}",
+                    f"Tags: {', '.join(task.tags)}",
+                    f"Timeout: {task.timeout_seconds}s",
+                    f"Human baseline: {task.human_baseline.median_time_seconds}s, {task.human_baseline.median_action_count} actions, {task.human_baseline.success_rate:.0%} success",
+                ]
+
                 if task.task_steps:
-                    print(f"\nTask Steps ({len(task.task_steps)}):")
+                    lines.append(f"\nTask Steps ({len(task.task_steps)}):")
                     for i, step in enumerate(task.task_steps, 1):
-                        print(f"  {i}. {step.description}")
-                
-                print(f"\nSuccess Criteria:")
+                        lines.append(f"  {i}. {step.description}")
+
+                lines.append("\nSuccess Criteria:")
                 for criterion in task.success_criteria:
-                    print(f"  - {criterion.description} (weight: {criterion.weight})")
+                    lines.append(f"  - {criterion.description} (weight: {criterion.weight})")
+
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print(f"Task '{args.task_id}' not found")
     
@@ -5,15 +5,59 @@ Handles loading, validation, and management of benchmark task definitions.
 """
 
 import json
+import mmap
 import os
-from dataclasses import dataclass, field
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 import jsonschema
 from jsonschema import validate, ValidationError
 
+# orjson parses roughly 5x faster than the stdlib; fall back transparently
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    _JSONDecodeError = (json.JSONDecodeError,)
 
-@dataclass
+# fastjsonschema compiles the schema into a specialized validator function,
+# avoiding a schema-AST walk per validated file
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Below this size the mmap setup cost outweighs the copy it saves
+_MMAP_THRESHOLD = 32 * 1024
+
+
+def iter_task_files(root: Union[str, Path]):
+    """
+    Yield paths (as strings) of all task .json files under root.
+
+    Uses os.scandir recursion rather than Path.rglob: DirEntry carries
+    cached stat/type info, so the walk avoids per-entry syscalls and
+    Path object construction.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.json') and entry.name != 'task_schema.json':
+                        yield entry.path
+        except OSError:
+            continue
+
+
+@dataclass(slots=True, frozen=True)
 class TaskSetup:
     """Task setup configuration"""
     required_apps: List[str] = field(default_factory=list)
@@ -22,7 +66,7 @@ class TaskSetup:
     test_data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaskStep:
     """Individual task execution step"""
     description: str
@@ -30,7 +74,7 @@ class TaskStep:
     success_indicators: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SuccessCriterion:
     """Criterion for determining task success"""
     type: str
@@ -41,14 +85,14 @@ class SuccessCriterion:
     element_role: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryPolicy:
     """Retry policy configuration"""
     max_retries: int = 0
     retry_delay_seconds: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HumanBaseline:
     """Human performance baseline"""
     median_time_seconds: float
@@ -57,7 +101,7 @@ class HumanBaseline:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationCheck:
     """Post-execution validation check"""
     type: str
@@ -66,35 +110,64 @@ class ValidationCheck:
     path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaskValidation:
     """Task validation configuration"""
     post_execution_checks: List[ValidationCheck] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BenchmarkTask:
-    """Complete benchmark task definition"""
+    """
+    Complete benchmark task definition
+
+    Steps and success criteria are kept as raw dicts and materialized into
+    TaskStep/SuccessCriterion objects on first access; commands like `list`
+    never touch them, so most loads skip those allocations entirely.
+    """
     task_id: str
     name: str
     description: str
     category: str
     complexity: str
-    success_criteria: List[SuccessCriterion]
+    _raw_criteria: List[Dict[str, Any]]
     timeout_seconds: int
     human_baseline: HumanBaseline
     tags: List[str] = field(default_factory=list)
     setup: Optional[TaskSetup] = None
-    task_steps: List[TaskStep] = field(default_factory=list)
+    _raw_steps: List[Dict[str, Any]] = field(default_factory=list)
     failure_modes: List[str] = field(default_factory=list)
     retry_policy: Optional[RetryPolicy] = None
     validation: Optional[TaskValidation] = None
-    
+    # Tasks sharing an exclusivity_group must not run concurrently; None
+    # means the task is parallel-safe
+    exclusivity_group: Optional[str] = None
+    # Pause after the task when the suite runs serially
+    cooldown_seconds: float = 2.0
+    file_path: Optional[str] = None
+    _criteria_cache: Optional[List[SuccessCriterion]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _steps_cache: Optional[List[TaskStep]] = field(
+        default=None, init=False, repr=False, compare=False)
+
     @property
-    def file_path(self) -> Optional[str]:
-        """Path to the task definition file"""
-        return getattr(self, '_file_path', None)
-    
+    def success_criteria(self) -> List[SuccessCriterion]:
+        """Success criteria, materialized from raw dicts on first access"""
+        if self._criteria_cache is None:
+            object.__setattr__(
+                self, '_criteria_cache',
+                [_build(SuccessCriterion, c) for c in self._raw_criteria])
+        return self._criteria_cache
+
+    @property
+    def task_steps(self) -> List[TaskStep]:
+        """Task steps, materialized from raw dicts on first access"""
+        if self._steps_cache is None:
+            object.__setattr__(
+                self, '_steps_cache',
+                [_build(TaskStep, s) for s in self._raw_steps])
+        return self._steps_cache
+
     def get_test_data(self, key: str, default: Any = None) -> Any:
         """Get test data value by key"""
         if self.setup and self.setup.test_data:
@@ -110,6 +183,20 @@ class BenchmarkTask:
         return self.complexity in ['high', 'very_high']
 
 
+# Field-name sets computed once so sub-objects can be constructed by kwargs
+# without a per-key copy loop; schema-permitted extra keys are dropped
+_TASK_FIELD_NAMES = {
+    cls: frozenset(f.name for f in fields(cls))
+    for cls in (TaskSetup, TaskStep, SuccessCriterion, RetryPolicy,
+                HumanBaseline, ValidationCheck)
+}
+
+
+def _build(cls, data: Dict[str, Any]):
+    """Construct a task sub-dataclass from a dict, ignoring unknown keys"""
+    return cls(**{k: data[k] for k in _TASK_FIELD_NAMES[cls] & data.keys()})
+
+
 class TaskLoader:
     """Loads and validates benchmark task definitions"""
     
@@ -126,17 +213,32 @@ class TaskLoader:
         
         self.tasks_directory = Path(tasks_directory)
         self.schema = self._load_schema()
-        self._task_cache: Dict[str, BenchmarkTask] = {}
+        self._validator = fastjsonschema.compile(self.schema) if fastjsonschema else None
+        # Maps file path -> (st_mtime_ns, st_size, task) so an edited file
+        # is detected by a cheap stat instead of served stale
+        self._task_cache: Dict[str, tuple] = {}
+        self._all_tasks_list: Optional[List[BenchmarkTask]] = None
+        self._scan_mtime_ns: Optional[int] = None
+        # Lookup indexes built alongside the task list
+        self._by_id: Dict[str, BenchmarkTask] = {}
+        self._by_category: Dict[str, List[BenchmarkTask]] = {}
+        self._by_complexity: Dict[str, List[BenchmarkTask]] = {}
+        self._by_tag: Dict[str, List[BenchmarkTask]] = {}
     
+    @property
+    def tasks(self) -> List[BenchmarkTask]:
+        """All loaded tasks, served from the cache when warm"""
+        return self.load_all_tasks()
+
     def _load_schema(self) -> Dict[str, Any]:
         """Load the task definition JSON schema"""
         schema_path = self.tasks_directory / 'task_schema.json'
         try:
-            with open(schema_path, 'r') as f:
-                return json.load(f)
+            with open(schema_path, 'rb') as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             raise FileNotFoundError(f"Task schema not found at {schema_path}")
-        except json.JSONDecodeError as e:
+        except _JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in task schema: {e}")
     
     def load_task(self, task_file: Union[str, Path]) -> BenchmarkTask:
@@ -154,37 +256,69 @@ class TaskLoader:
             ValidationError: If task definition is invalid
             ValueError: If JSON is malformed
         """
-        task_path = Path(task_file)
+        task_path = task_file if isinstance(task_file, Path) else Path(task_file)
         if not task_path.is_absolute():
             task_path = self.tasks_directory / task_path
         
-        # Check cache first
+        # Check cache first, keyed by path and validated against the file's
+        # current mtime/size so on-disk edits invalidate the entry
         cache_key = str(task_path)
-        if cache_key in self._task_cache:
-            return self._task_cache[cache_key]
-        
         try:
-            with open(task_path, 'r') as f:
-                task_data = json.load(f)
+            st = os.stat(task_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Task file not found: {task_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in task file {task_path}: {e}")
-        
-        # Validate against schema
-        try:
-            validate(instance=task_data, schema=self.schema)
-        except ValidationError as e:
-            raise ValidationError(f"Task validation failed for {task_path}: {e.message}")
-        
+
+        cached = self._task_cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        task_data = self._read_json(task_path, st.st_size)
+        self._validate_dict(task_data, task_path)
+
         # Convert to BenchmarkTask object
-        task = self._dict_to_task(task_data)
-        task._file_path = str(task_path)
-        
-        # Cache the task
-        self._task_cache[cache_key] = task
-        
+        try:
+            task = self._dict_to_task(task_data, file_path=str(task_path))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed task definition in {task_path}: {e}")
+
+        # Cache the task alongside the stat it was loaded from
+        self._task_cache[cache_key] = (st.st_mtime_ns, st.st_size, task)
+
         return task
+
+    def _read_json(self, task_path: Path, size: int) -> Dict[str, Any]:
+        """Read and parse a task JSON file"""
+        try:
+            with open(task_path, 'rb') as f:
+                # Memory-map large files so orjson parses straight from the
+                # page cache instead of an intermediate bytes copy; the
+                # stdlib parser cannot consume a buffer, so it always reads
+                if orjson is not None and size > _MMAP_THRESHOLD:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        # orjson rejects raw mmap objects; hand it a
+                        # memoryview over the mapping instead
+                        return _json_loads(memoryview(mm))
+                    finally:
+                        mm.close()
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Task file not found: {task_path}")
+        except _JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in task file {task_path}: {e}")
+
+    def _validate_dict(self, task_data: Dict[str, Any], task_path: Path):
+        """Validate parsed task data against the schema"""
+        if self._validator is not None:
+            try:
+                self._validator(task_data)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValidationError(f"Task validation failed for {task_path}: {e.message}")
+        else:
+            try:
+                validate(instance=task_data, schema=self.schema)
+            except ValidationError as e:
+                raise ValidationError(f"Task validation failed for {task_path}: {e.message}")
     
     def load_all_tasks(self) -> List[BenchmarkTask]:
         """
@@ -193,141 +327,158 @@ class TaskLoader:
         Returns:
             List of BenchmarkTask instances
         """
-        tasks = []
-        
+        # Serve repeated calls from the cached list to avoid re-walking the
+        # directory and re-parsing every file; a stat-only sweep detects
+        # task files added, removed, or edited since the last scan
+        tree_mtime = self._tree_mtime_ns()
+        if self._all_tasks_list is not None and tree_mtime == self._scan_mtime_ns:
+            return self._all_tasks_list
+
         # Recursively find all .json files (except schema)
-        for json_file in self.tasks_directory.rglob('*.json'):
-            if json_file.name == 'task_schema.json':
-                continue
-                
+        json_files = list(iter_task_files(self.tasks_directory))
+
+        # Reading and parsing task files is I/O-bound, so spread it across a
+        # thread pool; the GIL is released during file reads
+        tasks = []
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as executor:
+            for json_file, (task, error) in zip(
+                json_files, executor.map(self._load_task_safe, json_files)
+            ):
+                if task is not None:
+                    tasks.append(task)
+                else:
+                    print(f"Warning: Failed to load task from {json_file}: {error}")
+
+        self._all_tasks_list = tasks
+        self._scan_mtime_ns = tree_mtime
+        self._build_indexes(tasks)
+        return tasks
+
+    def _build_indexes(self, tasks: List[BenchmarkTask]):
+        """Build id/category/complexity/tag lookup indexes over the task list"""
+        self._by_id = {task.task_id: task for task in tasks}
+        self._by_category = {}
+        self._by_complexity = {}
+        self._by_tag = {}
+        for task in tasks:
+            self._by_category.setdefault(task.category, []).append(task)
+            self._by_complexity.setdefault(task.complexity, []).append(task)
+            for tag in task.tags:
+                self._by_tag.setdefault(tag, []).append(task)
+
+    def get_task(self, task_id: str) -> Optional[BenchmarkTask]:
+        """Get a single task by ID, or None if not found"""
+        self.load_all_tasks()
+        return self._by_id.get(task_id)
+
+    def _tree_mtime_ns(self) -> int:
+        """Newest mtime across the tasks tree (directories and .json files)"""
+        newest = 0
+        stack = [str(self.tasks_directory)]
+        while stack:
             try:
-                task = self.load_task(json_file)
-                tasks.append(task)
-            except (ValidationError, ValueError, FileNotFoundError) as e:
-                print(f"Warning: Failed to load task from {json_file}: {e}")
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            newest = max(newest, entry.stat().st_mtime_ns)
+                        elif entry.name.endswith('.json'):
+                            newest = max(newest, entry.stat().st_mtime_ns)
+            except OSError:
                 continue
-        
-        return tasks
-    
+        return newest
+
+    def _load_task_safe(self, task_file: Path) -> tuple:
+        """Load a task, returning (task, None) on success or (None, error) on failure"""
+        try:
+            return self.load_task(task_file), None
+        except (ValidationError, ValueError, FileNotFoundError) as e:
+            return None, e
+
     def get_tasks_by_category(self, category: str) -> List[BenchmarkTask]:
         """Get all tasks in a specific category"""
-        all_tasks = self.load_all_tasks()
-        return [task for task in all_tasks if task.category == category]
-    
+        self.load_all_tasks()
+        return self._by_category.get(category, [])
+
     def get_tasks_by_complexity(self, complexity: str) -> List[BenchmarkTask]:
         """Get all tasks with specific complexity level"""
-        all_tasks = self.load_all_tasks()
-        return [task for task in all_tasks if task.complexity == complexity]
-    
+        self.load_all_tasks()
+        return self._by_complexity.get(complexity, [])
+
     def get_tasks_by_tag(self, tag: str) -> List[BenchmarkTask]:
         """Get all tasks with a specific tag"""
-        all_tasks = self.load_all_tasks()
-        return [task for task in all_tasks if tag in task.tags]
+        self.load_all_tasks()
+        return self._by_tag.get(tag, [])
     
-    def _dict_to_task(self, task_data: Dict[str, Any]) -> BenchmarkTask:
-        """Convert dictionary to BenchmarkTask object"""
-        
-        # Parse setup
-        setup = None
-        if 'setup' in task_data:
-            setup_data = task_data['setup']
-            setup = TaskSetup(
-                required_apps=setup_data.get('required_apps', []),
-                preconditions=setup_data.get('preconditions', []),
-                cleanup=setup_data.get('cleanup', []),
-                test_data=setup_data.get('test_data', {})
-            )
-        
-        # Parse task steps
-        task_steps = []
-        if 'task_steps' in task_data:
-            for step_data in task_data['task_steps']:
-                step = TaskStep(
-                    description=step_data['description'],
-                    expected_actions=step_data['expected_actions'],
-                    success_indicators=step_data.get('success_indicators', [])
-                )
-                task_steps.append(step)
-        
-        # Parse success criteria
-        success_criteria = []
-        for criterion_data in task_data['success_criteria']:
-            criterion = SuccessCriterion(
-                type=criterion_data['type'],
-                weight=criterion_data['weight'],
-                description=criterion_data['description'],
-                expected_value=criterion_data.get('expected_value'),
-                app_name=criterion_data.get('app_name'),
-                element_role=criterion_data.get('element_role')
-            )
-            success_criteria.append(criterion)
-        
-        # Parse retry policy
-        retry_policy = None
-        if 'retry_policy' in task_data:
-            retry_data = task_data['retry_policy']
-            retry_policy = RetryPolicy(
-                max_retries=retry_data.get('max_retries', 0),
-                retry_delay_seconds=retry_data.get('retry_delay_seconds', 0)
-            )
-        
-        # Parse human baseline
-        baseline_data = task_data['human_baseline']
-        human_baseline = HumanBaseline(
-            median_time_seconds=baseline_data['median_time_seconds'],
-            median_action_count=baseline_data['median_action_count'],
-            success_rate=baseline_data['success_rate'],
-            notes=baseline_data.get('notes')
-        )
-        
-        # Parse validation
-        validation = None
-        if 'validation' in task_data:
-            val_data = task_data['validation']
-            checks = []
-            for check_data in val_data.get('post_execution_checks', []):
-                check = ValidationCheck(
-                    type=check_data['type'],
-                    app_name=check_data.get('app_name'),
-                    expected_value=check_data.get('expected_value'),
-                    path=check_data.get('path')
-                )
-                checks.append(check)
-            validation = TaskValidation(post_execution_checks=checks)
-        
+    def _dict_to_task(self, task_data: Dict[str, Any], file_path: Optional[str] = None) -> BenchmarkTask:
+        """
+        Convert dictionary to BenchmarkTask object
+
+        Schema validation has already enforced required fields, so
+        sub-objects are built by kwargs through _build; dataclass defaults
+        cover the optional fields.
+        """
+        setup_data = task_data.get('setup')
+        retry_data = task_data.get('retry_policy')
+        val_data = task_data.get('validation')
+
         return BenchmarkTask(
             task_id=task_data['task_id'],
             name=task_data['name'],
             description=task_data['description'],
-            category=task_data['category'],
-            complexity=task_data['complexity'],
-            success_criteria=success_criteria,
+            # category/complexity/tags draw from small value sets; interning
+            # collapses the duplicate strings parsed out of each file and
+            # lets the equality filters hit the identity fast path
+            category=sys.intern(task_data['category']),
+            complexity=sys.intern(task_data['complexity']),
+            _raw_criteria=task_data['success_criteria'],
             timeout_seconds=task_data['timeout_seconds'],
-            human_baseline=human_baseline,
-            tags=task_data.get('tags', []),
-            setup=setup,
-            task_steps=task_steps,
+            human_baseline=_build(HumanBaseline, task_data['human_baseline']),
+            tags=[sys.intern(t) for t in task_data.get('tags', [])],
+            setup=_build(TaskSetup, setup_data) if setup_data is not None else None,
+            _raw_steps=task_data.get('task_steps', []),
             failure_modes=task_data.get('failure_modes', []),
-            retry_policy=retry_policy,
-            validation=validation
+            retry_policy=_build(RetryPolicy, retry_data) if retry_data is not None else None,
+            validation=TaskValidation(
+                post_execution_checks=[
+                    _build(ValidationCheck, c) for c in val_data.get('post_execution_checks', [])
+                ]
+            ) if val_data is not None else None,
+            exclusivity_group=task_data.get('exclusivity_group'),
+            cooldown_seconds=task_data.get('cooldown_seconds', 2.0),
+            file_path=file_path
         )
     
     def validate_task_file(self, task_file: Union[str, Path]) -> bool:
         """
         Validate a task file without loading it into memory
-        
+
+        Stops after parsing and schema validation; no BenchmarkTask is
+        constructed or cached.
+
         Args:
             task_file: Path to task definition JSON file
-            
+
         Returns:
             True if valid, False otherwise
         """
+        task_path = task_file if isinstance(task_file, Path) else Path(task_file)
+        if not task_path.is_absolute():
+            task_path = self.tasks_directory / task_path
+
         try:
-            self.load_task(task_file)
+            task_data = self._read_json(task_path, task_path.stat().st_size)
+            self._validate_dict(task_data, task_path)
             return True
-        except (ValidationError, ValueError, FileNotFoundError):
+        except (ValidationError, ValueError, FileNotFoundError, OSError):
             return False
     
     def clear_cache(self):
         """Clear the task cache"""
         self._task_cache.clear()
+        self._all_tasks_list = None
+        self._scan_mtime_ns = None
+        self._by_id = {}
+        self._by_category = {}
+        self._by_complexity = {}
+        self._by_tag = {}
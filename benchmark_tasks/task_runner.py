@@ -4,12 +4,18 @@ Task Runner for Benchmark Tasks
 Handles execution of benchmark tasks and collection of performance metrics.
 """
 
+import functools
+import hashlib
 import os
+import re
 import sys
+import threading
 import time
 import json
 import subprocess
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -20,8 +26,185 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from benchmark_tasks.task_loader import BenchmarkTask, TaskLoader
 
+# Optional streaming JSON parser: keeps memory flat while reading large
+# runner action logs (falls back to buffering + json.loads when missing)
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-@dataclass
+# Optional NumPy: vectorizes report statistics over large result sets
+# (falls back to a fused single-pass Python loop when missing)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional fast JSON serializer for report output (stdlib json fallback)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One decoder for all runner-output parses: json.loads rebuilds decoder
+# machinery per call, and orjson skips the Python-level decoder entirely
+_JSON_DECODER = json.JSONDecoder()
+if orjson is not None:
+    _decode = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+else:
+    _decode = _JSON_DECODER.decode
+    _JSONDecodeError = json.JSONDecodeError
+
+# Optional filesystem watcher: tracks the newest run-log directory via
+# kernel notifications instead of rescanning logs/runs after every task
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# Configure logging once at import, and only when the application hasn't
+# already installed handlers of its own
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+# Criterion types scored purely on overall task success
+BINARY_SUCCESS_TYPES = frozenset({
+    "application_running",
+    "computation_completed",
+    "message_sent",
+    "page_loaded",
+    "folder_exists",
+})
+
+
+def _overall_score_kernel(success, base, speed, actions):
+    """
+    Vectorized overall_score arithmetic over parallel float64 arrays
+
+    Mirrors TaskResult.overall_score: NaN marks a missing ratio (the
+    comparisons then leave the multiplier untouched), failures score 0.
+    """
+    efficiency = np.ones_like(base)
+    with np.errstate(invalid='ignore'):
+        efficiency[speed > 1.5] *= 0.8
+        efficiency[speed < 0.8] *= 1.1
+        efficiency[actions > 1.3] *= 0.9
+    scores = np.minimum(1.0, base * efficiency)
+    scores[~success] = 0.0
+    return scores
+
+
+# Keep only this much of a child's stderr: the tail is where the real
+# error lives, and a runaway runner can otherwise buffer gigabytes
+_STDERR_TAIL_BYTES = 64 * 1024
+
+# On-disk result cache bounds: entries expire after the TTL and the
+# least recently used are swept once the directory exceeds the cap
+_RESULT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_RESULT_CACHE_MAX_ENTRIES = 1024
+
+
+def _drain_tail(stream, tail: deque, cap: int):
+    """Read stream in chunks into tail, evicting from the front past cap"""
+    total = 0
+    for chunk in iter(lambda: stream.read(4096), b''):
+        tail.append(chunk)
+        total += len(chunk)
+        # Keep at least the newest chunk even if it alone exceeds the cap
+        while total > cap and len(tail) > 1:
+            total -= len(tail.popleft())
+
+
+# Single compiled alternation for classifying runner stderr: one scan
+# instead of a chain of substring checks, named groups carry the category
+_ERR_PATTERNS = re.compile(
+    r"(?P<timeout>timed out|deadline exceeded)"
+    r"|(?P<build>error: (build|compile) failed)"
+    r"|(?P<missing>No such file|not found)",
+    re.IGNORECASE
+)
+
+
+# Per-process runner used by suite pool workers (set by _init_suite_worker)
+_worker_runner = None
+
+
+def _init_suite_worker(tasks_directory: Optional[Path]):
+    """Give each suite pool worker its own TaskRunner"""
+    global _worker_runner
+    _worker_runner = TaskRunner(tasks_directory)
+
+
+def _run_task_in_worker(task: BenchmarkTask) -> "TaskResult":
+    """Execute a task on the worker's process-local TaskRunner"""
+    return _worker_runner.run_task(task)
+
+
+class _LatestRunHandler(FileSystemEventHandler):
+    """Record newly created run directories on behalf of a TaskRunner"""
+
+    def __init__(self, runner: "TaskRunner"):
+        self._runner = runner
+
+    def on_created(self, event):
+        if event.is_directory:
+            with self._runner._latest_run_lock:
+                self._runner._latest_run_dir = Path(event.src_path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _score_criteria(types: Tuple[str, ...], success: bool) -> Tuple[Tuple[str, float], ...]:
+    """
+    Score criterion types for a pass/fail outcome
+
+    Pure function of its arguments, so results are memoized: suites re-run
+    the same (criterion types, success) combinations constantly. Every type
+    in BINARY_SUCCESS_TYPES — and the default for unknown types — currently
+    scores on overall success; the table keeps the seam for richer checks.
+    """
+    score = 1.0 if success else 0.0
+    return tuple((criterion_type, score) for criterion_type in types)
+
+
+@dataclass(slots=True)
+class SuiteStats:
+    """
+    Running aggregates over a suite's TaskResults
+
+    Updated once as each result arrives so report summaries are O(1)
+    divisions instead of re-traversing the whole result list.
+    """
+    n_total: int = 0
+    n_success: int = 0
+    sum_time: float = 0.0
+    n_time: int = 0
+    sum_speed: float = 0.0
+    n_speed: int = 0
+    sum_actions: float = 0.0
+    n_actions: int = 0
+
+    def update(self, result: "TaskResult"):
+        """Fold one result into the running aggregates"""
+        self.n_total += 1
+        self.n_success += result.success
+        if result.execution_time_seconds > 0:
+            self.sum_time += result.execution_time_seconds
+            self.n_time += 1
+        if result.speed_vs_human_baseline:
+            self.sum_speed += result.speed_vs_human_baseline
+            self.n_speed += 1
+        if result.action_count_vs_baseline:
+            self.sum_actions += result.action_count_vs_baseline
+            self.n_actions += 1
+
+
+@dataclass(slots=True)
 class TaskResult:
     """Result of executing a benchmark task"""
     task_id: str
@@ -31,9 +214,14 @@ class TaskResult:
     successful_actions: int
     failed_actions: int
     error_message: Optional[str] = None
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
-    
+    # Normalized failure bucket from _ERR_PATTERNS ("timeout", "build",
+    # "missing", "other"); None while the task hasn't failed
+    error_category: Optional[str] = None
+    # Wall-clock bounds as epoch floats; slots keep thousands of suite
+    # results compact, and datetimes are built on demand instead
+    start_epoch: float = 0.0
+    end_epoch: float = 0.0
+
     # Performance metrics
     element_targeting_accuracy: Optional[float] = None
     ui_graph_build_time: Optional[float] = None
@@ -47,6 +235,16 @@ class TaskResult:
     action_count_vs_baseline: Optional[float] = None  # ratio: agent_actions / human_actions
     success_criteria_scores: Dict[str, float] = field(default_factory=dict)
     
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Wall-clock start as a datetime (None if never recorded)"""
+        return datetime.fromtimestamp(self.start_epoch) if self.start_epoch else None
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Wall-clock end as a datetime (None if never recorded)"""
+        return datetime.fromtimestamp(self.end_epoch) if self.end_epoch else None
+
     @property
     def success_rate(self) -> float:
         """Calculate action success rate"""
@@ -84,21 +282,50 @@ class TaskResult:
 class TaskRunner:
     """Executes benchmark tasks and collects performance metrics"""
     
-    def __init__(self, tasks_directory: Optional[Path] = None):
+    def __init__(self, tasks_directory: Optional[Path] = None, use_daemon: bool = False,
+                 cache_dir: Optional[Path] = None, use_result_cache: bool = False):
         """
         Initialize task runner
-        
+
         Args:
             tasks_directory: Path to directory containing task definitions
+            use_daemon: Stream tasks through one long-lived agently-runner
+                process instead of spawning one per task. Requires a runner
+                binary built with `--serve` support.
+            cache_dir: Directory for cached TaskResults keyed by task
+                description, test data, and Swift source fingerprint
+            use_result_cache: Serve unchanged tasks from cache_dir instead
+                of re-executing. Opt-in on purpose: a cache hit looks like
+                a speedup but carries no new signal.
         """
         self.task_loader = TaskLoader(tasks_directory)
         self.logger = logging.getLogger(__name__)
-        
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Resolved once; Path(__file__).parent.parent on every task run
+        # costs filesystem path resolution for a constant answer
+        self._project_root = Path(__file__).resolve().parent.parent
+        # Running aggregates over the most recent suite run, plus the
+        # identities of the results they were folded from so report
+        # generation only trusts them for that exact result set
+        self._stats = SuiteStats()
+        self._stats_result_ids: List[int] = []
+        # Fingerprint of the Swift sources the last successful build covered
+        self._build_fingerprint: Optional[str] = None
+        self.use_daemon = use_daemon
+        self._runner_proc: Optional[subprocess.Popen] = None
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.use_result_cache = use_result_cache and self.cache_dir is not None
+
+        # Watch logs/runs for new run directories so result parsing reads
+        # one attribute instead of rescanning (and stat-ing) the whole
+        # history; without watchdog we fall back to the directory scan
+        self._logs_dir = self._project_root / "logs" / "runs"
+        self._latest_run_dir: Optional[Path] = None
+        self._latest_run_lock = threading.Lock()
+        self._log_observer = None
+        if Observer is not None and self._logs_dir.is_dir():
+            self._log_observer = Observer()
+            self._log_observer.schedule(_LatestRunHandler(self), str(self._logs_dir))
+            self._log_observer.start()
     
     def run_task(self, task: BenchmarkTask, timeout_override: Optional[int] = None) -> TaskResult:
         """
@@ -111,37 +338,52 @@ class TaskRunner:
         Returns:
             TaskResult with execution metrics
         """
-        start_time = datetime.now()
+        # Monotonic clock for the duration; wall clock only for the record
+        # fields, immune to NTP adjustments mid-task
+        t0 = time.perf_counter_ns()
+        start_epoch = time.time()
         timeout = timeout_override or task.timeout_seconds
-        
-        self.logger.info(f"Starting task: {task.task_id} - {task.name}")
-        
+
+        self.logger.info("Starting task: %s - %s", task.task_id, task.name)
+
+        # Serve an unchanged task straight from the result cache: same
+        # description, test data, and Swift sources mean the previous
+        # result is still valid
+        cache_path = None
+        if self.use_result_cache:
+            cache_path = self.cache_dir / f"{self._result_cache_key(task)}.json"
+            cached = self._load_cached_result(cache_path)
+            if cached is not None:
+                self.logger.info("Result cache hit: %s", task.task_id)
+                return cached
+
         try:
             # Execute the task using the existing planner
             result = self._execute_with_planner(task, timeout)
-            
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
-            
+
+            execution_time = (time.perf_counter_ns() - t0) / 1e9
+
             # Calculate performance metrics
-            result.start_time = start_time
-            result.end_time = end_time
+            result.start_epoch = start_epoch
+            result.end_epoch = time.time()
             result.execution_time_seconds = execution_time
-            
+
             # Calculate baseline comparisons
             if task.human_baseline:
                 result.speed_vs_human_baseline = execution_time / task.human_baseline.median_time_seconds
                 result.action_count_vs_baseline = result.total_actions / task.human_baseline.median_action_count
-            
-            self.logger.info(f"Task completed: {task.task_id} - Success: {result.success}, Time: {execution_time:.2f}s")
-            
+
+            self.logger.info("Task completed: %s - Success: %s, Time: %.2fs", task.task_id, result.success, execution_time)
+
+            if cache_path is not None and result.success:
+                self._store_cached_result(cache_path, result)
+
             return result
-            
+
         except Exception as e:
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
-            
-            self.logger.error(f"Task failed with exception: {task.task_id} - {str(e)}")
+            execution_time = (time.perf_counter_ns() - t0) / 1e9
+
+            self.logger.error("Task failed with exception: %s - %s", task.task_id, e)
             
             return TaskResult(
                 task_id=task.task_id,
@@ -151,51 +393,150 @@ class TaskRunner:
                 successful_actions=0,
                 failed_actions=1,
                 error_message=str(e),
-                start_time=start_time,
-                end_time=end_time
+                start_epoch=start_epoch,
+                end_epoch=time.time()
             )
     
-    def run_task_suite(self, tasks: List[BenchmarkTask]) -> List[TaskResult]:
+    def run_task_suite(self, tasks: List[BenchmarkTask], parallelism: int = 1) -> List[TaskResult]:
         """
         Execute a suite of benchmark tasks
-        
+
         Args:
             tasks: List of BenchmarkTask instances to execute
-            
+            parallelism: Number of tasks to run concurrently (1 = serial)
+
         Returns:
             List of TaskResult instances
         """
-        results = []
-        
+        return [result for _, result in self.run_task_suite_iter(tasks, parallelism)]
+
+    def run_task_suite_iter(self, tasks: List[BenchmarkTask], parallelism: int = 1):
+        """
+        Execute a suite of benchmark tasks, yielding results as they complete
+
+        Lets callers report progress incrementally and keeps memory bounded
+        for very large suites. With parallelism > 1, tasks without an
+        exclusivity_group are dispatched to a process pool; tasks sharing a
+        group run serially after the parallel batch.
+
+        Args:
+            tasks: List of BenchmarkTask instances to execute
+            parallelism: Number of tasks to run concurrently (1 = serial)
+
+        Yields:
+            (BenchmarkTask, TaskResult) pairs in completion order
+        """
+        # Build once up front so a broken build fails the suite immediately
+        # instead of failing every task in turn
+        self._ensure_swift_built(self._project_root)
+
+        # Fresh aggregates per suite; updated as each result lands
+        self._stats = SuiteStats()
+        self._stats_result_ids = []
+
+        if parallelism <= 1:
+            yield from self._run_suite_serial(tasks)
+            return
+
+        parallel_tasks = [t for t in tasks if t.exclusivity_group is None]
+        exclusive_groups: Dict[str, List[BenchmarkTask]] = {}
+        for task in tasks:
+            if task.exclusivity_group is not None:
+                exclusive_groups.setdefault(task.exclusivity_group, []).append(task)
+
+        if parallel_tasks:
+            # Each worker gets its own TaskRunner via the initializer so no
+            # runner state is shared across processes
+            with ProcessPoolExecutor(
+                max_workers=parallelism,
+                initializer=_init_suite_worker,
+                initargs=(self.task_loader.tasks_directory,)
+            ) as executor:
+                futures = {executor.submit(_run_task_in_worker, t): t for t in parallel_tasks}
+                try:
+                    for future in as_completed(futures):
+                        task = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            self.logger.error("Unexpected error running task %s: %s", task.task_id, e)
+                            result = self._error_result(task, e)
+                        self._fold_result(result)
+                        yield task, result
+                except KeyboardInterrupt:
+                    self.logger.info("Task suite interrupted by user")
+                    executor.shutdown(cancel_futures=True)
+                    return
+
+        # Tasks in an exclusivity group contend for shared state (e.g. one
+        # GUI application); run each group serially
+        for group_tasks in exclusive_groups.values():
+            yield from self._run_suite_serial(group_tasks)
+
+    def _fold_result(self, result: TaskResult):
+        """Fold one result into the suite aggregates, remembering which
+        result it came from"""
+        self._stats.update(result)
+        self._stats_result_ids.append(id(result))
+
+    def _run_suite_serial(self, tasks: List[BenchmarkTask]):
+        """Run tasks one at a time, honoring per-task cooldowns"""
         for i, task in enumerate(tasks, 1):
-            self.logger.info(f"Running task {i}/{len(tasks)}: {task.name}")
-            
+            self.logger.info("Running task %d/%d: %s", i, len(tasks), task.name)
+
             try:
                 result = self.run_task(task)
-                results.append(result)
-                
-                # Brief pause between tasks
-                time.sleep(2)
-                
+                self._fold_result(result)
+                yield task, result
+
+                # Pause between tasks only while the system is still busy
+                if task.cooldown_seconds > 0:
+                    self._wait_for_ready(task.cooldown_seconds)
+
             except KeyboardInterrupt:
                 self.logger.info("Task suite interrupted by user")
                 break
             except Exception as e:
-                self.logger.error(f"Unexpected error running task {task.task_id}: {e}")
-                # Create error result
-                error_result = TaskResult(
-                    task_id=task.task_id,
-                    success=False,
-                    execution_time_seconds=0,
-                    total_actions=0,
-                    successful_actions=0,
-                    failed_actions=1,
-                    error_message=str(e)
-                )
-                results.append(error_result)
+                self.logger.error("Unexpected error running task %s: %s", task.task_id, e)
+                result = self._error_result(task, e)
+                self._fold_result(result)
+                yield task, result
                 continue
-        
-        return results
+
+    def _wait_for_ready(self, max_seconds: float):
+        """
+        Wait until the system looks idle again, up to max_seconds
+
+        The old fixed sleep burned the full cooldown after every task;
+        polling the readiness probe instead collapses the gap to ~50ms on
+        a warm system while still backing off on a loaded one.
+        """
+        deadline = time.monotonic() + max_seconds
+        while time.monotonic() < deadline:
+            if self._system_idle():
+                return
+            time.sleep(0.05)
+
+    def _system_idle(self) -> bool:
+        """Whether the previous task's load has drained from the system"""
+        try:
+            load = os.getloadavg()[0]
+        except OSError:
+            # Load averages unavailable on this platform; nothing to probe
+            return True
+        return load < (os.cpu_count() or 1)
+
+    def _error_result(self, task: BenchmarkTask, error: Exception) -> TaskResult:
+        """Build the failure TaskResult for an unexpected suite error"""
+        return TaskResult(
+            task_id=task.task_id,
+            success=False,
+            execution_time_seconds=0,
+            total_actions=0,
+            successful_actions=0,
+            failed_actions=1,
+            error_message=str(error)
+        )
     
     def _execute_with_planner(self, task: BenchmarkTask, timeout: int) -> TaskResult:
         """
@@ -209,47 +550,53 @@ class TaskRunner:
             TaskResult with execution details
         """
         # Use the real Swift AgentlyRunner instead of fake planning-only execution
-        project_root = Path(__file__).parent.parent
-        
+        project_root = self._project_root
+
         try:
-            # Build the Swift project first
-            build_cmd = ["swift", "build"]
-            build_process = subprocess.run(
-                build_cmd,
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=60  # Build timeout
-            )
-            
-            if build_process.returncode != 0:
-                raise subprocess.CalledProcessError(build_process.returncode, build_cmd, build_process.stderr)
-            
-            # Execute the task using the real Swift AgentlyRunner
+            # Make sure the Swift project is built (no-op when the sources
+            # haven't changed since the last build)
+            self._ensure_swift_built(project_root)
+
+            # Expose test data as environment variables if available
+            env_overrides = {}
+            if task.setup and task.setup.test_data:
+                for key, value in task.setup.test_data.items():
+                    env_overrides[f"AGENTLY_TEST_{key.upper()}"] = str(value)
+
+            # Stream through the persistent runner when enabled; otherwise
+            # spawn a one-shot process per task
+            if self.use_daemon:
+                return self._execute_with_daemon(task, timeout, env_overrides, project_root)
+
             cmd = [
                 "swift", "run", "agently",
                 "--task", task.description,
                 "--format", "json"
             ]
-            
-            # Add test data as environment variables if available
-            env = os.environ.copy()
-            if task.setup and task.setup.test_data:
-                for key, value in task.setup.test_data.items():
-                    env[f"AGENTLY_TEST_{key.upper()}"] = str(value)
-            
-            # Execute the real Swift AgentlyRunner
-            process = subprocess.run(
-                cmd,
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                env=env
-            )
-            
+
+            # Only copy the environment when there are overrides to apply;
+            # env=None lets the child inherit without a Python-side copy
+            if env_overrides:
+                env = os.environ.copy()
+                env.update(env_overrides)
+            else:
+                env = None
+
+            # Parse stdout incrementally when ijson is available: action
+            # logs can run to megabytes and never need to sit in memory
+            if ijson is not None:
+                return self._execute_streaming(task, cmd, project_root, env, timeout)
+
+            # Execute the real Swift AgentlyRunner, keeping only the tail
+            # of its stderr
+            returncode, stdout, stderr = self._run_bounded(cmd, project_root, env, timeout)
+
             # Parse the output to extract metrics from real execution
-            return self._parse_agently_runner_output(task, process)
+            return self._parse_runner_output(
+                task, returncode == 0,
+                stdout.decode(errors='replace'),
+                stderr.decode(errors='replace')
+            )
             
         except subprocess.TimeoutExpired:
             return TaskResult(
@@ -282,6 +629,264 @@ class TaskRunner:
                 error_message=f"Swift AgentlyRunner execution failed: {e}"
             )
     
+    def _run_bounded(self, cmd: List[str], cwd: Path, env: Optional[Dict[str, str]],
+                     timeout: int, tail_bytes: int = _STDERR_TAIL_BYTES):
+        """
+        Run a child process, capturing full stdout but only a stderr tail
+
+        A misbehaving runner that spams stack traces would otherwise grow
+        an unbounded capture buffer (and bloat error_message); the reader
+        threads keep memory O(tail_bytes) for stderr no matter how noisy
+        the child gets.
+
+        Returns:
+            (returncode, stdout_bytes, stderr_tail_bytes)
+
+        Raises:
+            subprocess.TimeoutExpired: If the child overruns the timeout
+        """
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env
+        )
+
+        stdout_chunks: List[bytes] = []
+        stderr_tail: deque = deque()
+        readers = (
+            threading.Thread(
+                target=lambda: stdout_chunks.extend(iter(lambda: proc.stdout.read(4096), b'')),
+                daemon=True
+            ),
+            threading.Thread(
+                target=_drain_tail, args=(proc.stderr, stderr_tail, tail_bytes), daemon=True
+            ),
+        )
+        for reader in readers:
+            reader.start()
+
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join()
+
+        return returncode, b''.join(stdout_chunks), b''.join(stderr_tail)
+
+    def _execute_streaming(self, task: BenchmarkTask, cmd: List[str],
+                           project_root: Path, env: Optional[Dict[str, str]], timeout: int) -> TaskResult:
+        """
+        Run AgentlyRunner and parse its JSON output as it streams
+
+        ijson walks top-level keys of stdout as they arrive, so the action
+        counters update incrementally and memory stays flat no matter how
+        large the action log grows. stderr drains on a side thread to avoid
+        a pipe deadlock when error output exceeds the 64KB pipe buffer.
+
+        Raises:
+            subprocess.TimeoutExpired: If the task overruns its timeout
+        """
+        proc = subprocess.Popen(
+            cmd,
+            cwd=project_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env
+        )
+
+        stderr_tail: deque = deque()
+        drainer = threading.Thread(
+            target=_drain_tail,
+            args=(proc.stderr, stderr_tail, _STDERR_TAIL_BYTES),
+            daemon=True
+        )
+        drainer.start()
+
+        # Kill the process on timeout; the parse loop then sees EOF
+        timed_out = threading.Event()
+
+        def _kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill_on_timeout)
+        timer.start()
+
+        total_actions = 0
+        successful_actions = 0
+        parse_ok = True
+        try:
+            for key, value in ijson.kvitems(proc.stdout, ''):
+                if key == 'total_actions':
+                    total_actions = value
+                elif key == 'successful_actions':
+                    successful_actions = value
+        except ijson.common.JSONError:
+            # JSONError covers both truncated output (IncompleteJSONError)
+            # and complete-but-invalid output, which the pure-python
+            # backend reports as UnexpectedSymbol; either way fall back
+            # to success-based counting below
+            parse_ok = False
+        finally:
+            returncode = proc.wait()
+            timer.cancel()
+            drainer.join()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        success = returncode == 0
+        stderr = b''.join(stderr_tail).decode(errors='replace') if stderr_tail else None
+
+        if parse_ok:
+            failed_actions = total_actions - successful_actions
+        else:
+            # Mirror the buffered path: unparseable output falls back to
+            # basic success/failure counting
+            total_actions = 1
+            successful_actions = 1 if success else 0
+            failed_actions = 0 if success else 1
+
+        return self._result_from_counts(
+            task, success, total_actions, successful_actions, failed_actions, stderr
+        )
+
+    def _ensure_swift_built(self, project_root: Path):
+        """
+        Build the Swift package if its sources changed since the last build
+
+        Fingerprints Package.swift and the Sources tree by (path, mtime,
+        size) and only spawns `swift build` when the fingerprint moves, so
+        a suite pays the build cost once instead of once per task.
+
+        Raises:
+            subprocess.CalledProcessError: If the build fails
+        """
+        fingerprint = self._swift_fingerprint(project_root)
+        if fingerprint == self._build_fingerprint:
+            return
+
+        build_cmd = ["swift", "build"]
+        build_process = subprocess.run(
+            build_cmd,
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            timeout=60  # Build timeout
+        )
+
+        if build_process.returncode != 0:
+            raise subprocess.CalledProcessError(build_process.returncode, build_cmd, build_process.stderr)
+
+        self._build_fingerprint = fingerprint
+
+    def _swift_fingerprint(self, project_root: Path) -> str:
+        """Hash (path, mtime, size) of Package.swift and everything in Sources/"""
+        entries = []
+
+        package_file = project_root / "Package.swift"
+        try:
+            st = package_file.stat()
+            entries.append((str(package_file), st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+
+        for dirpath, _, filenames in os.walk(project_root / "Sources"):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, st.st_mtime_ns, st.st_size))
+
+        entries.sort()
+        digest = hashlib.sha256()
+        for entry in entries:
+            digest.update(repr(entry).encode())
+        return digest.hexdigest()
+
+    def _result_cache_key(self, task: BenchmarkTask) -> str:
+        """
+        Cache key covering every input that can change a task's result
+
+        Task description, test data, and the Swift source fingerprint all
+        feed the digest so a stale hit can't masquerade as a speedup.
+        """
+        digest = hashlib.sha256()
+        digest.update(task.description.encode())
+        test_data = task.setup.test_data if task.setup else None
+        digest.update(json.dumps(test_data or {}, sort_keys=True).encode())
+        digest.update(self._swift_fingerprint(self._project_root).encode())
+        return digest.hexdigest()
+
+    def _load_cached_result(self, cache_path: Path) -> Optional[TaskResult]:
+        """Read a cached TaskResult, or None on miss, expiry, or damage"""
+        try:
+            st = cache_path.stat()
+        except OSError:
+            return None
+        if time.time() - st.st_mtime > _RESULT_CACHE_TTL_SECONDS:
+            return None
+        try:
+            result = TaskResult(**_decode(cache_path.read_text()))
+        except (_JSONDecodeError, TypeError, OSError):
+            return None
+        # Refresh mtime so the sweep evicts least recently used entries
+        os.utime(cache_path)
+        return result
+
+    def _store_cached_result(self, cache_path: Path, result: TaskResult):
+        """Persist a TaskResult and sweep expired/excess cache entries"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = asdict(result)
+            if orjson is not None:
+                cache_path.write_bytes(orjson.dumps(payload))
+            else:
+                cache_path.write_text(json.dumps(payload))
+        except OSError as e:
+            self.logger.debug("Failed to write result cache entry: %s", e)
+            return
+        self._sweep_result_cache()
+
+    def _sweep_result_cache(self):
+        """Drop expired entries, then the least recently used past the cap"""
+        try:
+            entries = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith('.json')
+            ]
+        except OSError:
+            return
+
+        now = time.time()
+        fresh = []
+        for mtime, path in entries:
+            if now - mtime > _RESULT_CACHE_TTL_SECONDS:
+                self._remove_quiet(path)
+            else:
+                fresh.append((mtime, path))
+
+        if len(fresh) > _RESULT_CACHE_MAX_ENTRIES:
+            fresh.sort()
+            for _, path in fresh[:len(fresh) - _RESULT_CACHE_MAX_ENTRIES]:
+                self._remove_quiet(path)
+
+    @staticmethod
+    def _remove_quiet(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     def _parse_agently_runner_output(self, task: BenchmarkTask, process: subprocess.CompletedProcess) -> TaskResult:
         """
         Parse Swift AgentlyRunner output and extract metrics from real execution
@@ -293,48 +898,166 @@ class TaskRunner:
         Returns:
             TaskResult with parsed metrics from real execution
         """
-        # Basic success determination
-        success = process.returncode == 0
-        
+        return self._parse_runner_output(
+            task, process.returncode == 0, process.stdout, process.stderr
+        )
+
+    def _parse_runner_output(self, task: BenchmarkTask, success: bool,
+                             stdout: Optional[str], stderr: Optional[str]) -> TaskResult:
+        """
+        Build a TaskResult from raw AgentlyRunner output
+
+        Shared by the one-shot subprocess path and the persistent daemon,
+        which has no CompletedProcess to hand over.
+        """
         # Try to parse JSON output from AgentlyRunner
         total_actions = 0
         successful_actions = 0
         failed_actions = 0
-        
+
         try:
-            if success and process.stdout:
+            if success and stdout:
                 # Parse the JSON output from Swift AgentlyRunner
-                output_data = json.loads(process.stdout)
+                output_data = _decode(stdout)
                 total_actions = output_data.get('total_actions', 0)
                 successful_actions = output_data.get('successful_actions', 0)
                 failed_actions = total_actions - successful_actions
             else:
                 # If no JSON output or failure, mark as failed
                 failed_actions = 1 if not success else 0
-        except json.JSONDecodeError:
+        except _JSONDecodeError:
             # If we can't parse JSON, fall back to basic success/failure
             total_actions = 1
             successful_actions = 1 if success else 0
             failed_actions = 0 if success else 1
-        
-        # Initialize result with real execution data
-        result = TaskResult(
+
+        return self._result_from_counts(
+            task, success, total_actions, successful_actions, failed_actions, stderr
+        )
+
+    def _result_from_counts(self, task: BenchmarkTask, success: bool,
+                            total_actions: int, successful_actions: int,
+                            failed_actions: int, stderr: Optional[str]) -> TaskResult:
+        """
+        Assemble a complete TaskResult from parsed action counts and stderr
+
+        Error classification and criteria scoring are fused into the
+        constructor call: one traversal, no post-hoc mutation of the
+        freshly built result.
+        """
+        error_message = None
+        error_category = None
+        if not success and stderr:
+            error_message = stderr.strip()
+            match = _ERR_PATTERNS.search(stderr)
+            error_category = match.lastgroup if match else "other"
+
+        return TaskResult(
             task_id=task.task_id,
             success=success,
             execution_time_seconds=0.0,  # Will be set by caller
             total_actions=total_actions,
             successful_actions=successful_actions,
-            failed_actions=failed_actions
+            failed_actions=failed_actions,
+            error_message=error_message,
+            error_category=error_category,
+            success_criteria_scores=dict(_score_criteria(
+                tuple(c.type for c in task.success_criteria), success
+            ))
         )
-        
-        # Extract any error messages
-        if not success and process.stderr:
-            result.error_message = process.stderr.strip()
-        
-        # Evaluate success criteria against real execution
-        result.success_criteria_scores = self._evaluate_success_criteria(task, result)
-        
-        return result
+
+    def _ensure_daemon(self, project_root: Path) -> subprocess.Popen:
+        """Spawn the persistent runner process if it isn't already alive"""
+        proc = self._runner_proc
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                ["swift", "run", "agently", "--serve", "--format", "json"],
+                cwd=project_root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1  # Line-buffered: one request line, one result line
+            )
+            self._runner_proc = proc
+        return proc
+
+    def _execute_with_daemon(self, task: BenchmarkTask, timeout: int,
+                             env_overrides: Dict[str, str], project_root: Path) -> TaskResult:
+        """
+        Run a task through the persistent runner daemon
+
+        Writes one newline-delimited JSON request to the daemon's stdin and
+        reads one JSON result line back, so each task costs a pipe
+        round-trip instead of a full process launch. A timer tears the
+        daemon down if the task overruns its timeout; the next task
+        respawns it.
+        """
+        proc = self._ensure_daemon(project_root)
+        request = {"task": task.description, "env": env_overrides}
+
+        timer = threading.Timer(timeout, self._kill_daemon)
+        timer.start()
+        try:
+            proc.stdin.write(json.dumps(request) + "\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+        except (BrokenPipeError, OSError) as e:
+            return TaskResult(
+                task_id=task.task_id,
+                success=False,
+                execution_time_seconds=0,
+                total_actions=0,
+                successful_actions=0,
+                failed_actions=1,
+                error_message=f"Runner daemon pipe failed: {e}"
+            )
+        finally:
+            timer.cancel()
+
+        if not line:
+            # EOF: the daemon exited or the timeout timer killed it
+            return TaskResult(
+                task_id=task.task_id,
+                success=False,
+                execution_time_seconds=timeout,
+                total_actions=0,
+                successful_actions=0,
+                failed_actions=1,
+                error_message=f"Task timed out after {timeout} seconds"
+            )
+
+        try:
+            success = bool(_decode(line).get('success', True))
+        except _JSONDecodeError:
+            success = False
+
+        return self._parse_runner_output(task, success, line, None)
+
+    def _kill_daemon(self):
+        """Terminate the runner daemon (timeout path); unblocks readline"""
+        proc = self._runner_proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+
+    def close(self):
+        """Shut down the runner daemon and log observer, if running"""
+        if self._log_observer is not None:
+            self._log_observer.stop()
+            self._log_observer = None
+        proc = self._runner_proc
+        if proc is not None:
+            if proc.poll() is None:
+                try:
+                    proc.stdin.close()
+                    proc.terminate()
+                    proc.wait(timeout=5)
+                except Exception:
+                    proc.kill()
+            self._runner_proc = None
+
+    def __del__(self):
+        self.close()
 
     def _parse_planner_output(self, task: BenchmarkTask, process: subprocess.CompletedProcess) -> TaskResult:
         """
@@ -361,13 +1084,9 @@ class TaskRunner:
         )
         
         # Try to find the latest run log directory to extract detailed metrics
-        logs_dir = Path(__file__).parent.parent / "logs" / "runs"
-        if logs_dir.exists():
-            # Find the most recent run directory
-            run_dirs = [d for d in logs_dir.iterdir() if d.is_dir()]
-            if run_dirs:
-                latest_run = max(run_dirs, key=lambda d: d.stat().st_mtime)
-                result = self._extract_metrics_from_run_log(result, latest_run)
+        latest_run = self._latest_run_directory()
+        if latest_run is not None:
+            result = self._extract_metrics_from_run_log(result, latest_run)
         
         # Extract any error messages
         if not success and process.stderr:
@@ -378,6 +1097,25 @@ class TaskRunner:
         
         return result
     
+    def _latest_run_directory(self) -> Optional[Path]:
+        """
+        Most recently created run-log directory, or None if there is none
+
+        Served from the watchdog observer when available — one attribute
+        read instead of readdir plus a stat per historical run folder —
+        falling back to a full scan otherwise (or before the first event).
+        """
+        with self._latest_run_lock:
+            if self._latest_run_dir is not None:
+                return self._latest_run_dir
+
+        if not self._logs_dir.exists():
+            return None
+        run_dirs = [d for d in self._logs_dir.iterdir() if d.is_dir()]
+        if not run_dirs:
+            return None
+        return max(run_dirs, key=lambda d: d.stat().st_mtime)
+
     def _extract_metrics_from_run_log(self, result: TaskResult, run_dir: Path) -> TaskResult:
         """
         Extract detailed metrics from run log directory
@@ -393,16 +1131,15 @@ class TaskRunner:
             # Look for metadata file
             metadata_file = run_dir / "run_metadata.json"
             if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    # Extract any available metrics from metadata
-                    # This would need to be updated based on your actual log format
+                metadata = _decode(metadata_file.read_text())
+                # Extract any available metrics from metadata
+                # This would need to be updated based on your actual log format
             
             # Look for action logs or other metric files
             # This is a placeholder - you'd implement based on your actual logging structure
             
         except Exception as e:
-            self.logger.debug(f"Failed to extract metrics from run log: {e}")
+            self.logger.debug("Failed to extract metrics from run log: %s", e)
         
         return result
     
@@ -417,80 +1154,110 @@ class TaskRunner:
         Returns:
             Dictionary mapping criterion type to score (0.0-1.0)
         """
-        scores = {}
-        
-        for criterion in task.success_criteria:
-            # Basic scoring based on overall success
-            # This is a simplified implementation - you'd want more sophisticated validation
-            if criterion.type == "application_running":
-                scores[criterion.type] = 1.0 if result.success else 0.0
-            elif criterion.type == "computation_completed":
-                scores[criterion.type] = 1.0 if result.success else 0.0
-            elif criterion.type == "message_sent":
-                scores[criterion.type] = 1.0 if result.success else 0.0
-            elif criterion.type == "page_loaded":
-                scores[criterion.type] = 1.0 if result.success else 0.0
-            elif criterion.type == "folder_exists":
-                scores[criterion.type] = 1.0 if result.success else 0.0
-            else:
-                # Default scoring
-                scores[criterion.type] = 1.0 if result.success else 0.0
-        
-        return scores
+        # Basic scoring based on overall success, memoized per
+        # (criterion types, success) combination
+        return dict(_score_criteria(
+            tuple(c.type for c in task.success_criteria), result.success
+        ))
     
-    def generate_report(self, results: List[TaskResult]) -> Dict[str, Any]:
+    def generate_report(self, results: List[TaskResult], detailed: bool = True) -> Dict[str, Any]:
         """
         Generate performance report from task results
-        
+
         Args:
             results: List of TaskResult instances
-            
+            detailed: Include per-task failure and performance listings;
+                pass False when only the summary aggregates are needed
+
         Returns:
             Dictionary containing performance analysis
         """
         if not results:
             return {"error": "No results to analyze"}
-        
+
         total_tasks = len(results)
-        successful_tasks = sum(1 for r in results if r.success)
-        success_rate = successful_tasks / total_tasks
-        
-        # Calculate timing statistics
-        execution_times = [r.execution_time_seconds for r in results if r.execution_time_seconds > 0]
-        avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0
-        
-        # Calculate baseline comparisons
-        speed_ratios = [r.speed_vs_human_baseline for r in results if r.speed_vs_human_baseline]
-        avg_speed_ratio = sum(speed_ratios) / len(speed_ratios) if speed_ratios else None
-        
-        action_ratios = [r.action_count_vs_baseline for r in results if r.action_count_vs_baseline]
-        avg_action_ratio = sum(action_ratios) / len(action_ratios) if action_ratios else None
-        
-        # Group by category
-        category_stats = {}
-        for result in results:
-            # You'd need to match result back to task for category info
-            # This is simplified for now
-            pass
-        
-        return {
+
+        stats = self._stats
+        if (stats.n_total == total_tasks
+                and self._stats_result_ids == [id(r) for r in results]):
+            # The running aggregates were folded from exactly these result
+            # objects (matching length alone would accept any same-sized
+            # list): summary is a handful of divisions, no traversal at all
+            successful_tasks = stats.n_success
+            avg_execution_time = stats.sum_time / stats.n_time if stats.n_time else 0
+            avg_speed_ratio = stats.sum_speed / stats.n_speed if stats.n_speed else None
+            avg_action_ratio = stats.sum_actions / stats.n_actions if stats.n_actions else None
+        elif np is not None:
+            # One pass to build the array, then C-loop aggregates; missing
+            # ratios become NaN and drop out via nanmean
+            arr = np.fromiter(
+                (
+                    (
+                        r.success,
+                        r.execution_time_seconds,
+                        r.speed_vs_human_baseline if r.speed_vs_human_baseline else np.nan,
+                        r.action_count_vs_baseline if r.action_count_vs_baseline else np.nan,
+                    )
+                    for r in results
+                ),
+                dtype=[('s', '?'), ('t', 'f8'), ('sv', 'f8'), ('av', 'f8')],
+                count=total_tasks
+            )
+            successful_tasks = int(np.count_nonzero(arr['s']))
+            times = arr['t'][arr['t'] > 0]
+            avg_execution_time = float(times.mean()) if times.size else 0
+            with np.errstate(invalid='ignore'):
+                speed_mean = np.nanmean(arr['sv'])
+                action_mean = np.nanmean(arr['av'])
+            avg_speed_ratio = float(speed_mean) if not np.isnan(speed_mean) else None
+            avg_action_ratio = float(action_mean) if not np.isnan(action_mean) else None
+        else:
+            # Fused single pass over the results instead of one loop per
+            # statistic
+            successful_tasks = 0
+            time_sum = 0.0
+            time_count = 0
+            speed_sum = 0.0
+            speed_count = 0
+            action_sum = 0.0
+            action_count = 0
+            for r in results:
+                successful_tasks += r.success
+                if r.execution_time_seconds > 0:
+                    time_sum += r.execution_time_seconds
+                    time_count += 1
+                if r.speed_vs_human_baseline:
+                    speed_sum += r.speed_vs_human_baseline
+                    speed_count += 1
+                if r.action_count_vs_baseline:
+                    action_sum += r.action_count_vs_baseline
+                    action_count += 1
+            avg_execution_time = time_sum / time_count if time_count else 0
+            avg_speed_ratio = speed_sum / speed_count if speed_count else None
+            avg_action_ratio = action_sum / action_count if action_count else None
+
+        report: Dict[str, Any] = {
             "summary": {
                 "total_tasks": total_tasks,
                 "successful_tasks": successful_tasks,
-                "success_rate": success_rate,
+                "success_rate": successful_tasks / total_tasks,
                 "average_execution_time": avg_execution_time,
                 "average_speed_vs_human": avg_speed_ratio,
                 "average_action_efficiency": avg_action_ratio
-            },
-            "failed_tasks": [
+            }
+        }
+
+        if detailed:
+            report["failed_tasks"] = [
                 {
                     "task_id": r.task_id,
                     "error": r.error_message,
+                    "error_category": r.error_category,
                     "execution_time": r.execution_time_seconds
                 }
                 for r in results if not r.success
-            ],
-            "performance_details": [
+            ]
+            report["performance_details"] = [
                 {
                     "task_id": r.task_id,
                     "success": r.success,
@@ -501,4 +1268,64 @@ class TaskRunner:
                 }
                 for r in results
             ]
-        }
+
+        return report
+
+    def batch_overall_scores(self, results: List[TaskResult]) -> List[float]:
+        """
+        Recompute overall scores for many results in one vectorized pass
+
+        Re-scoring a historical archive calls overall_score thousands of
+        times through branchy Python arithmetic; with NumPy the inputs are
+        packed once (criteria scores pre-averaged on the way in) and the
+        score math runs as array operations in _overall_score_kernel.
+        Falls back to the per-result property without NumPy.
+
+        Args:
+            results: List of TaskResult instances
+
+        Returns:
+            Overall scores in the same order as results
+        """
+        if np is None:
+            return [r.overall_score for r in results]
+
+        arr = np.fromiter(
+            (
+                (
+                    r.success,
+                    sum(r.success_criteria_scores.values()) / len(r.success_criteria_scores)
+                    if r.success_criteria_scores else 0.5,
+                    r.speed_vs_human_baseline if r.speed_vs_human_baseline else np.nan,
+                    r.action_count_vs_baseline if r.action_count_vs_baseline else np.nan,
+                )
+                for r in results
+            ),
+            dtype=[('s', '?'), ('b', 'f8'), ('sv', 'f8'), ('av', 'f8')],
+            count=len(results)
+        )
+        return _overall_score_kernel(arr['s'], arr['b'], arr['sv'], arr['av']).tolist()
+
+    def generate_report_bytes(self, results: List[TaskResult], detailed: bool = True) -> bytes:
+        """
+        Serialize the performance report to UTF-8 JSON bytes
+
+        With orjson installed this skips CPython's per-float string
+        formatting, which dominates when performance_details runs to
+        thousands of entries; OPT_SERIALIZE_NUMPY covers any NumPy scalars
+        from the vectorized aggregation and OPT_NAIVE_UTC any naive
+        datetimes. Falls back to json.dumps().encode() otherwise.
+
+        Args:
+            results: List of TaskResult instances
+            detailed: Include per-task failure and performance listings
+
+        Returns:
+            The report encoded as UTF-8 JSON
+        """
+        report = self.generate_report(results, detailed)
+        if orjson is not None:
+            return orjson.dumps(
+                report, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+            )
+        return json.dumps(report).encode()
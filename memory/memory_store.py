@@ -2,18 +2,50 @@
 SQLite-based episodic memory for Agently.
 """
 
+import hashlib
 import json
+import re
 import sqlite3
 import logging
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# Optional fast JSON codec for snapshot/record payloads (stdlib json
+# fallback). Encoded output stays text so it feeds jsonb(?) unchanged.
+try:
+    import orjson
 
-@dataclass
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+def _encode_ui(graph: Dict[str, Any]) -> tuple:
+    """Canonical UTF-8 encoding of a UI graph plus its checksum.
+
+    One serialization pass produces both the stored BLOB and the
+    deduplication key, so the snapshot store path never encodes the
+    same graph twice. Keys are sorted so identical UI states hash
+    identically regardless of dict construction order.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(graph, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(graph, sort_keys=True, separators=(',', ':')).encode()
+    return payload, hashlib.sha256(payload).hexdigest()
+
+
+@dataclass(slots=True)
 class UISnapshot:
     """Represents a UI state snapshot."""
     
@@ -22,13 +54,24 @@ class UISnapshot:
     active_application: Optional[str]
     element_count: int
     checksum: str  # Hash of the UI state for deduplication
-    
+    # Memoized canonical encoding of ui_graph; filled lazily by
+    # encoded() so hashing and persistence share one serialization
+    _encoded: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+    def encoded(self) -> bytes:
+        """Canonical encoding of ui_graph, computed once and reused."""
+        if self._encoded is None:
+            self._encoded = _encode_ui(self.ui_graph)[0]
+        return self._encoded
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            **asdict(self),
             'timestamp': self.timestamp.isoformat(),
-            'ui_graph': json.dumps(self.ui_graph)
+            'ui_graph': self.encoded().decode(),
+            'active_application': self.active_application,
+            'element_count': self.element_count,
+            'checksum': self.checksum
         }
     
     @classmethod
@@ -36,14 +79,35 @@ class UISnapshot:
         """Create from dictionary."""
         return cls(
             timestamp=datetime.fromisoformat(data['timestamp']),
-            ui_graph=json.loads(data['ui_graph']),
+            ui_graph=_json_loads(data['ui_graph']),
             active_application=data['active_application'],
             element_count=data['element_count'],
             checksum=data['checksum']
         )
 
+    @classmethod
+    def from_graph(cls, ui_graph: Dict[str, Any],
+                   active_application: Optional[str] = None,
+                   timestamp: Optional[datetime] = None) -> 'UISnapshot':
+        """Build a snapshot from a raw UI graph in one pass.
 
-@dataclass
+        element_count and the dedup checksum both come from the same
+        canonical encoding the store path persists, so callers never
+        walk or serialize the graph a second time.
+        """
+        payload, checksum = _encode_ui(ui_graph)
+        elements = ui_graph.get('elements')
+        return cls(
+            timestamp=timestamp or datetime.now(),
+            ui_graph=ui_graph,
+            active_application=active_application or ui_graph.get('activeApplication'),
+            element_count=len(elements) if elements is not None else len(ui_graph),
+            checksum=checksum,
+            _encoded=payload
+        )
+
+
+@dataclass(slots=True)
 class ExecutionRecord:
     """Records an action execution and its results."""
     
@@ -58,12 +122,17 @@ class ExecutionRecord:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        # Explicit literal: asdict would deep-copy every nested action
+        # dict just for the JSON fields to be overwritten anyway
         return {
-            **asdict(self),
             'timestamp': self.timestamp.isoformat(),
-            'action_plan': json.dumps(self.action_plan),
-            'executed_actions': json.dumps(self.executed_actions),
-            'error_messages': json.dumps(self.error_messages)
+            'task_description': self.task_description,
+            'ui_snapshot_id': self.ui_snapshot_id,
+            'action_plan': _json_dumps(self.action_plan),
+            'executed_actions': _json_dumps(self.executed_actions),
+            'success_rate': self.success_rate,
+            'total_execution_time': self.total_execution_time,
+            'error_messages': _json_dumps(self.error_messages)
         }
     
     @classmethod
@@ -73,14 +142,36 @@ class ExecutionRecord:
             timestamp=datetime.fromisoformat(data['timestamp']),
             task_description=data['task_description'],
             ui_snapshot_id=data['ui_snapshot_id'],
-            action_plan=json.loads(data['action_plan']),
-            executed_actions=json.loads(data['executed_actions']),
+            action_plan=_json_loads(data['action_plan']),
+            executed_actions=_json_loads(data['executed_actions']),
             success_rate=data['success_rate'],
             total_execution_time=data['total_execution_time'],
-            error_messages=json.loads(data['error_messages'])
+            error_messages=_json_loads(data['error_messages'])
         )
 
 
+def _snap_row(snapshot: UISnapshot) -> tuple:
+    """Insert parameters for a UISnapshot (cheaper than asdict).
+
+    The checksum is derived from the same canonical bytes that get
+    stored, so the dedup key always matches the persisted graph even
+    if the caller precomputed `snapshot.checksum` differently. The
+    bytes come from the snapshot's memoized encoding, so a graph
+    already serialized for hashing is not encoded again here.
+    """
+    payload = snapshot.encoded()
+    checksum = hashlib.sha256(payload).hexdigest()
+    return (
+        snapshot.timestamp.isoformat(),
+        payload,
+        snapshot.active_application,
+        snapshot.element_count,
+        checksum
+    )
+
+
+
+
 class MemoryStore:
     """SQLite-based memory store for Agently."""
     
@@ -94,6 +185,137 @@ class MemoryStore:
         
         self.db_path = db_path
         self._init_database()
+
+        # One long-lived connection for all operations: per-call
+        # sqlite3.connect() setup and the rollback-journal fsync per
+        # insert dominate the hot store paths otherwise. WAL with
+        # synchronous=NORMAL batches fsyncs at checkpoint time;
+        # isolation_level=None leaves transaction control explicit.
+        # cached_statements keeps prepared statements alive inside
+        # sqlite3, so reusing the precomputed SQL strings below skips
+        # sqlite3_prepare_v2 on every hot insert/select
+        self.conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False,
+            cached_statements=256
+        )
+        # check_same_thread=False shares this connection between the
+        # agent's writer thread and main-thread callers, so every
+        # statement runs under one lock: without it, a main-thread
+        # write landing inside another thread's explicit BEGIN..COMMIT
+        # joins that transaction and is lost on its rollback
+        self._lock = threading.Lock()
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA mmap_size=268435456",
+            "PRAGMA cache_size=-65536",
+        ):
+            self.conn.execute(pragma)
+
+        # JSONB (SQLite >= 3.45) stores the pre-parsed binary tree, so
+        # JSON columns skip re-tokenization on every read and json_*
+        # queries run against the tree directly. Probe for it and fall
+        # back to plain text storage on older SQLite builds.
+        try:
+            self.conn.execute("SELECT jsonb('{}')")
+            self._jsonb = True
+        except sqlite3.OperationalError:
+            self._jsonb = False
+
+        # CAST lets the raw UTF-8 bytes from _encode_ui feed jsonb()
+        # too (it is a no-op for the text parameters)
+        json_param = "jsonb(CAST(? AS TEXT))" if self._jsonb else "?"
+        json_col = "json({0}) AS {0}" if self._jsonb else "{0}"
+        self._insert_snapshot_sql = f"""
+            INSERT INTO ui_snapshots
+            (timestamp, ui_graph, active_application, element_count, checksum)
+            VALUES (?, {json_param}, ?, ?, ?)
+        """
+        self._insert_record_sql = f"""
+            INSERT INTO execution_records
+            (timestamp, task_description, ui_snapshot_id, action_plan_id,
+             executed_actions_id, success_rate, total_execution_time, error_messages)
+            VALUES (?, ?, ?, ?, ?, ?, ?, {json_param})
+        """
+        self._intern_plan_sql = f"""
+            INSERT OR IGNORE INTO plans (hash, blob) VALUES (?, {json_param})
+        """
+        # Columns in dataclass field order so rows construct by direct
+        # tuple unpacking, skipping Row objects and intermediate dicts
+        self._select_snapshot_sql = f"""
+            SELECT timestamp, {json_col.format('ui_graph')},
+                   active_application, element_count, checksum
+            FROM ui_snapshots
+        """
+        json_expr = "json({0})" if self._jsonb else "{0}"
+        self._select_record_sql = f"""
+            SELECT e.timestamp, e.task_description, e.ui_snapshot_id,
+                   {json_expr.format('pa.blob')},
+                   {json_expr.format('pe.blob')},
+                   e.success_rate, e.total_execution_time,
+                   {json_expr.format('e.error_messages')}
+            FROM execution_records e
+            JOIN plans pa ON pa.id = e.action_plan_id
+            JOIN plans pe ON pe.id = e.executed_actions_id
+        """
+        self._select_record_fts_sql = f"""
+            SELECT e.timestamp, e.task_description, e.ui_snapshot_id,
+                   {json_expr.format('pa.blob')},
+                   {json_expr.format('pe.blob')},
+                   e.success_rate, e.total_execution_time,
+                   {json_expr.format('e.error_messages')}
+            FROM execution_records_fts f
+            JOIN execution_records e ON e.id = f.rowid
+            JOIN plans pa ON pa.id = e.action_plan_id
+            JOIN plans pe ON pe.id = e.executed_actions_id
+        """
+
+        self._put_plan_sql = f"""
+            INSERT OR REPLACE INTO plan_cache (task_hash, ui_checksum, plan)
+            VALUES (?, ?, {json_param})
+        """
+        self._get_plan_sql = f"""
+            SELECT {json_col.format('plan')} FROM plan_cache
+            WHERE task_hash = ? AND ui_checksum = ?
+              AND created_at > datetime('now', ?)
+        """
+
+        # Full query texts assembled once: identical strings on every
+        # call keep sqlite3's statement cache hot
+        self._select_snapshot_by_id_sql = self._select_snapshot_sql + " WHERE id = ?"
+        self._select_similar_fts_sql = self._select_record_fts_sql + """
+            WHERE execution_records_fts MATCH ?
+            ORDER BY bm25(execution_records_fts), e.success_rate DESC
+            LIMIT ?
+        """
+        self._select_similar_like_sql = self._select_record_sql + """
+            WHERE e.task_description LIKE ?
+            ORDER BY e.success_rate DESC, e.timestamp DESC
+            LIMIT ?
+        """
+
+        # Plan-only variants: the success threshold lives in SQL and
+        # only the action_plan blob comes back, so filtered-out rows
+        # are never fetched or parsed
+        self._select_plans_fts_sql = f"""
+            SELECT {json_expr.format('pa.blob')}
+            FROM execution_records_fts f
+            JOIN execution_records e ON e.id = f.rowid
+            JOIN plans pa ON pa.id = e.action_plan_id
+            WHERE execution_records_fts MATCH ? AND e.success_rate > ?
+            ORDER BY bm25(execution_records_fts), e.success_rate DESC
+            LIMIT ?
+        """
+        self._select_plans_like_sql = f"""
+            SELECT {json_expr.format('pa.blob')}
+            FROM execution_records e
+            JOIN plans pa ON pa.id = e.action_plan_id
+            WHERE e.task_description LIKE ? AND e.success_rate > ?
+            ORDER BY e.success_rate DESC, e.timestamp DESC
+            LIMIT ?
+        """
+
         logger.info(f"Initialized memory store at {db_path}")
     
     def _init_database(self):
@@ -103,7 +325,7 @@ class MemoryStore:
                 CREATE TABLE IF NOT EXISTS ui_snapshots (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     timestamp TEXT NOT NULL,
-                    ui_graph TEXT NOT NULL,
+                    ui_graph BLOB NOT NULL,
                     active_application TEXT,
                     element_count INTEGER NOT NULL,
                     checksum TEXT NOT NULL UNIQUE,
@@ -111,96 +333,286 @@ class MemoryStore:
                 )
             """)
             
+            # Content-addressed plan payloads: identical action plans
+            # (common once plan caching kicks in) are stored once and
+            # referenced by id from execution_records
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS plans (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    hash TEXT NOT NULL UNIQUE,
+                    blob BLOB NOT NULL
+                )
+            """)
+
+            # Detect the pre-plans schema (inline action_plan blobs) so
+            # existing databases get rebuilt once below
+            migrate = "action_plan" in {
+                row[1] for row in conn.execute("PRAGMA table_info(execution_records)")
+            }
+            if migrate:
+                for trigger in ("execution_records_fts_ai",
+                                "execution_records_fts_ad",
+                                "execution_records_fts_au"):
+                    conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                conn.execute(
+                    "ALTER TABLE execution_records RENAME TO execution_records_v1"
+                )
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS execution_records (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     timestamp TEXT NOT NULL,
                     task_description TEXT NOT NULL,
                     ui_snapshot_id INTEGER NOT NULL,
-                    action_plan TEXT NOT NULL,
-                    executed_actions TEXT NOT NULL,
+                    action_plan_id INTEGER NOT NULL,
+                    executed_actions_id INTEGER NOT NULL,
                     success_rate REAL NOT NULL,
                     total_execution_time REAL NOT NULL,
-                    error_messages TEXT NOT NULL,
+                    error_messages BLOB NOT NULL,
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (ui_snapshot_id) REFERENCES ui_snapshots (id)
+                    FOREIGN KEY (ui_snapshot_id) REFERENCES ui_snapshots (id),
+                    FOREIGN KEY (action_plan_id) REFERENCES plans (id),
+                    FOREIGN KEY (executed_actions_id) REFERENCES plans (id)
                 )
             """)
+
+            if migrate:
+                self._migrate_inline_plans(conn)
             
+            # Exact-match memoization of LLM plans: a cache hit skips the
+            # network round-trip and inference entirely
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_snapshots_checksum 
-                ON ui_snapshots (checksum)
+                CREATE TABLE IF NOT EXISTS plan_cache (
+                    task_hash TEXT NOT NULL,
+                    ui_checksum TEXT NOT NULL,
+                    plan BLOB NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (task_hash, ui_checksum)
+                )
             """)
-            
+
+            # The UNIQUE constraint on checksum already maintains its own
+            # index; the explicit one we used to create doubled every
+            # snapshot write for nothing
+            conn.execute("DROP INDEX IF EXISTS idx_snapshots_checksum")
+
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp 
+                CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp
                 ON ui_snapshots (timestamp)
             """)
-            
+
+            # Covering index matching the similar-executions ordering, so
+            # the LIKE fallback's top-N resolves as an index range scan
+            # with no sort step
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_execution_task 
-                ON execution_records (task_description)
+                CREATE INDEX IF NOT EXISTS idx_exec_task_score
+                ON execution_records (task_description, success_rate DESC, timestamp DESC)
             """)
-            
+            conn.execute("DROP INDEX IF EXISTS idx_execution_task")
+
+            # Lets the orphan-snapshot anti-join in cleanup_old_records
+            # probe referencing records per snapshot instead of
+            # materializing every ui_snapshot_id
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_exec_snap
+                ON execution_records (ui_snapshot_id)
+            """)
+
+            # Full-text shadow table over task descriptions: MATCH walks
+            # an inverted index with BM25 ranking instead of a LIKE scan
+            # over every row. Triggers keep it in sync with the content
+            # table. Skipped gracefully on builds without FTS5.
+            try:
+                conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS execution_records_fts
+                    USING fts5(task_description, content='execution_records', content_rowid='id')
+                """)
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS execution_records_fts_ai
+                    AFTER INSERT ON execution_records BEGIN
+                        INSERT INTO execution_records_fts(rowid, task_description)
+                        VALUES (new.id, new.task_description);
+                    END
+                """)
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS execution_records_fts_ad
+                    AFTER DELETE ON execution_records BEGIN
+                        INSERT INTO execution_records_fts(execution_records_fts, rowid, task_description)
+                        VALUES ('delete', old.id, old.task_description);
+                    END
+                """)
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS execution_records_fts_au
+                    AFTER UPDATE ON execution_records BEGIN
+                        INSERT INTO execution_records_fts(execution_records_fts, rowid, task_description)
+                        VALUES ('delete', old.id, old.task_description);
+                        INSERT INTO execution_records_fts(rowid, task_description)
+                        VALUES (new.id, new.task_description);
+                    END
+                """)
+                if migrate:
+                    # Migrated rows were copied without the triggers in
+                    # place; rebuild the index from the content table
+                    conn.execute("""
+                        INSERT INTO execution_records_fts(execution_records_fts)
+                        VALUES ('rebuild')
+                    """)
+                self._fts = True
+            except sqlite3.OperationalError:
+                self._fts = False
+
             conn.commit()
-    
+
+    @staticmethod
+    def _migrate_inline_plans(conn: sqlite3.Connection):
+        """One-time rebuild moving inline plan blobs into the plans table.
+
+        Runs inside _init_database after the old execution_records has
+        been renamed to execution_records_v1 and the new shape created.
+        Row ids are preserved so the FTS shadow table stays valid.
+        """
+        def intern(blob) -> int:
+            data = blob if isinstance(blob, bytes) else str(blob).encode()
+            digest = hashlib.sha256(data).hexdigest()
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO plans (hash, blob) VALUES (?, ?)",
+                (digest, blob)
+            )
+            if cursor.rowcount:
+                return cursor.lastrowid
+            return conn.execute(
+                "SELECT id FROM plans WHERE hash = ?", (digest,)
+            ).fetchone()[0]
+
+        rows = conn.execute("""
+            SELECT id, timestamp, task_description, ui_snapshot_id,
+                   action_plan, executed_actions, success_rate,
+                   total_execution_time, error_messages, created_at
+            FROM execution_records_v1
+        """).fetchall()
+        for row in rows:
+            conn.execute(
+                """
+                INSERT INTO execution_records
+                (id, timestamp, task_description, ui_snapshot_id,
+                 action_plan_id, executed_actions_id, success_rate,
+                 total_execution_time, error_messages, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (row[0], row[1], row[2], row[3], intern(row[4]),
+                 intern(row[5]), row[6], row[7], row[8], row[9])
+            )
+        conn.execute("DROP TABLE execution_records_v1")
+        logger.info(f"Migrated {len(rows)} execution records to content-addressed plans")
+
+    def _intern_plan(self, obj) -> int:
+        """Store a plan payload once, keyed by content hash, return its id.
+
+        Callers already hold the store lock (directly or via the batch
+        transaction), so this must not take it again.
+        """
+        payload = _json_dumps(obj)
+        digest = hashlib.sha256(payload.encode()).hexdigest()
+        cursor = self.conn.execute(self._intern_plan_sql, (digest, payload))
+        if cursor.rowcount:
+            return cursor.lastrowid
+        return self.conn.execute(
+            "SELECT id FROM plans WHERE hash = ?", (digest,)
+        ).fetchone()[0]
+
+    def _exec_row(self, record: ExecutionRecord) -> tuple:
+        """Insert parameters for an ExecutionRecord.
+
+        Plan payloads are interned through the content-addressed plans
+        table, so repeated plans serialize and store only once.
+        """
+        return (
+            record.timestamp.isoformat(),
+            record.task_description,
+            record.ui_snapshot_id,
+            self._intern_plan(record.action_plan),
+            self._intern_plan(record.executed_actions),
+            record.success_rate,
+            record.total_execution_time,
+            _json_dumps(record.error_messages)
+        )
+
     def store_ui_snapshot(self, snapshot: UISnapshot) -> int:
         """Store a UI snapshot, return the ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            try:
-                cursor = conn.execute("""
-                    INSERT INTO ui_snapshots 
-                    (timestamp, ui_graph, active_application, element_count, checksum)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    snapshot.timestamp.isoformat(),
-                    json.dumps(snapshot.ui_graph),
-                    snapshot.active_application,
-                    snapshot.element_count,
-                    snapshot.checksum
-                ))
-                
-                snapshot_id = cursor.lastrowid
-                conn.commit()
-                logger.debug(f"Stored UI snapshot with ID {snapshot_id}")
-                return snapshot_id
-                
-            except sqlite3.IntegrityError:
-                # Snapshot with this checksum already exists
+        conn = self.conn
+        row = _snap_row(snapshot)
+        try:
+            with self._lock:
+                cursor = conn.execute(self._insert_snapshot_sql, row)
+
+            snapshot_id = cursor.lastrowid
+            logger.debug(f"Stored UI snapshot with ID {snapshot_id}")
+            return snapshot_id
+
+        except sqlite3.IntegrityError:
+            # Snapshot with this checksum already exists; look it up by
+            # the checksum just derived from the canonical bytes
+            with self._lock:
                 cursor = conn.execute(
                     "SELECT id FROM ui_snapshots WHERE checksum = ?",
-                    (snapshot.checksum,)
+                    (row[4],)
                 )
                 result = cursor.fetchone()
-                if result:
-                    logger.debug(f"UI snapshot already exists with ID {result[0]}")
-                    return result[0]
-                else:
-                    raise
-    
+            if result:
+                logger.debug(f"UI snapshot already exists with ID {result[0]}")
+                return result[0]
+            else:
+                raise
+
     def store_execution_record(self, record: ExecutionRecord) -> int:
         """Store an execution record, return the ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO execution_records 
-                (timestamp, task_description, ui_snapshot_id, action_plan, 
-                 executed_actions, success_rate, total_execution_time, error_messages)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                record.timestamp.isoformat(),
-                record.task_description,
-                record.ui_snapshot_id,
-                json.dumps(record.action_plan),
-                json.dumps(record.executed_actions),
-                record.success_rate,
-                record.total_execution_time,
-                json.dumps(record.error_messages)
-            ))
-            
-            record_id = cursor.lastrowid
-            conn.commit()
-            logger.debug(f"Stored execution record with ID {record_id}")
-            return record_id
+        with self._lock:
+            cursor = self.conn.execute(self._insert_record_sql, self._exec_row(record))
+
+        record_id = cursor.lastrowid
+        logger.debug(f"Stored execution record with ID {record_id}")
+        return record_id
+
+    def store_ui_snapshots(self, snapshots: List[UISnapshot]) -> int:
+        """Store many UI snapshots in one transaction, return rows inserted.
+
+        Amortizes statement prepare and journal sync over the whole batch;
+        snapshots whose checksum already exists are skipped.
+        """
+        if not snapshots:
+            return 0
+        return self._executemany_in_transaction(
+            self._insert_snapshot_sql.replace(
+                "INSERT INTO", "INSERT OR IGNORE INTO"
+            ),
+            map(_snap_row, snapshots)
+        )
+
+    def store_execution_records(self, records: List[ExecutionRecord]) -> int:
+        """Store many execution records in one transaction, return rows inserted."""
+        if not records:
+            return 0
+        return self._executemany_in_transaction(
+            self._insert_record_sql, map(self._exec_row, records)
+        )
+
+    def _executemany_in_transaction(self, sql: str, rows) -> int:
+        """Run executemany inside a single explicit transaction.
+
+        Holds the store lock for the whole BEGIN..COMMIT so statements
+        from other threads cannot join (and be rolled back with) this
+        transaction.
+        """
+        conn = self.conn
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.executemany(sql, rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return cursor.rowcount
     
     def get_similar_executions(
         self, 
@@ -208,107 +620,217 @@ class MemoryStore:
         limit: int = 5
     ) -> List[ExecutionRecord]:
         """Get execution records for similar tasks."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            # Simple text matching - could be enhanced with semantic similarity
-            cursor = conn.execute("""
-                SELECT * FROM execution_records 
-                WHERE task_description LIKE ? 
-                ORDER BY success_rate DESC, timestamp DESC
-                LIMIT ?
-            """, (f"%{task_description}%", limit))
-            
-            records = []
-            for row in cursor.fetchall():
-                record_data = dict(row)
-                records.append(ExecutionRecord.from_dict(record_data))
-            
-            return records
+        # Full-text search when available: BM25-ranked inverted-index
+        # lookup instead of a LIKE scan over every record
+        with self._lock:
+            cursor = None
+            if self._fts:
+                match_query = self._fts_match_query(task_description)
+                if match_query:
+                    cursor = self.conn.execute(
+                        self._select_similar_fts_sql, (match_query, limit)
+                    )
+
+            if cursor is None:
+                # Simple text matching fallback for builds without FTS5
+                cursor = self.conn.execute(
+                    self._select_similar_like_sql, (f"%{task_description}%", limit)
+                )
+
+            rows = cursor.fetchall()
+
+        # Build records straight from the tuples: no Row wrapper, no
+        # intermediate dict, locals for the per-row parse calls
+        _loads = _json_loads
+        _fromiso = datetime.fromisoformat
+        return [
+            ExecutionRecord(
+                _fromiso(ts), task, snapshot_id,
+                _loads(plan), _loads(executed), rate, total_time, _loads(errors)
+            )
+            for ts, task, snapshot_id, plan, executed, rate, total_time, errors
+            in rows
+        ]
     
-    def get_successful_plans_for_task(self, task_description: str) -> List[Dict[str, Any]]:
-        """Get successful action plans for a similar task."""
-        records = self.get_similar_executions(task_description)
-        
-        successful_plans = []
-        for record in records:
-            if record.success_rate > 0.8:  # 80% success threshold
-                successful_plans.append(record.action_plan)
-        
-        return successful_plans
+    @staticmethod
+    def _fts_match_query(text: str) -> str:
+        """Quote and OR-join tokens into a safe FTS5 MATCH expression."""
+        return " OR ".join(f'"{token}"' for token in re.findall(r"\w+", text))
+
+    def get_successful_plans_for_task(
+        self,
+        task_description: str,
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Get successful action plans for a similar task.
+
+        The 80% success threshold is applied in SQL and only the plan
+        blob is selected, so rows below the bar are never fetched or
+        JSON-parsed.
+        """
+        with self._lock:
+            cursor = None
+            if self._fts:
+                match_query = self._fts_match_query(task_description)
+                if match_query:
+                    cursor = self.conn.execute(
+                        self._select_plans_fts_sql, (match_query, 0.8, limit)
+                    )
+
+            if cursor is None:
+                cursor = self.conn.execute(
+                    self._select_plans_like_sql, (f"%{task_description}%", 0.8, limit)
+                )
+
+            rows = cursor.fetchall()
+
+        return [_json_loads(row[0]) for row in rows]
     
     def get_ui_snapshot(self, snapshot_id: int) -> Optional[UISnapshot]:
         """Get a UI snapshot by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM ui_snapshots WHERE id = ?",
+        with self._lock:
+            row = self.conn.execute(
+                self._select_snapshot_by_id_sql,
                 (snapshot_id,)
+            ).fetchone()
+        if row:
+            ts, graph, app, count, checksum = row
+            return UISnapshot(
+                datetime.fromisoformat(ts), _json_loads(graph), app, count, checksum
             )
-            
-            row = cursor.fetchone()
-            if row:
-                snapshot_data = dict(row)
-                return UISnapshot.from_dict(snapshot_data)
-            
-            return None
+
+        return None
     
+    def get_cached_plan(
+        self, task: str, ui_checksum: str, max_age_days: int = 7
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a memoized plan for this exact task and UI state.
+
+        Entries older than max_age_days are ignored, so a plan that was
+        once cached cannot be served forever; expired rows are purged by
+        cleanup_old_records. created_at and 'now' are both UTC.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                self._get_plan_sql,
+                (self._task_hash(task), ui_checksum, f"-{max_age_days} days")
+            ).fetchone()
+        return _json_loads(row[0]) if row else None
+
+    def put_cached_plan(self, task: str, ui_checksum: str, plan: Dict[str, Any]):
+        """Memoize a generated plan for this task and UI state."""
+        with self._lock:
+            self.conn.execute(
+                self._put_plan_sql,
+                (self._task_hash(task), ui_checksum, _json_dumps(plan))
+            )
+
+    @staticmethod
+    def _task_hash(task: str) -> str:
+        return hashlib.sha256(task.encode()).hexdigest()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get memory store statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM ui_snapshots")
-            snapshot_count = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(*) FROM execution_records")
-            execution_count = cursor.fetchone()[0]
-            
-            cursor = conn.execute("""
-                SELECT AVG(success_rate) FROM execution_records 
-                WHERE timestamp > datetime('now', '-7 days')
-            """)
-            recent_success_rate = cursor.fetchone()[0] or 0.0
-            
-            cursor = conn.execute("""
-                SELECT COUNT(DISTINCT task_description) FROM execution_records
-            """)
-            unique_tasks = cursor.fetchone()[0]
-            
-            return {
-                "total_ui_snapshots": snapshot_count,
-                "total_executions": execution_count,
-                "unique_tasks": unique_tasks,
-                "recent_success_rate": recent_success_rate,
-                "db_path": self.db_path
-            }
+        # All four metrics in one statement: a single prepare/execute
+        # round-trip instead of four, and execution_records is read in
+        # one pass. 'localtime' keeps the window comparison consistent
+        # with the naive local timestamps we store.
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM ui_snapshots),
+                    COUNT(*),
+                    COUNT(DISTINCT task_description),
+                    AVG(CASE WHEN timestamp > datetime('now', 'localtime', '-7 days')
+                             THEN success_rate END)
+                FROM execution_records
+            """).fetchone()
+        snapshot_count, execution_count, unique_tasks, recent_success_rate = row
+        recent_success_rate = recent_success_rate or 0.0
+
+        return {
+            "total_ui_snapshots": snapshot_count,
+            "total_executions": execution_count,
+            "unique_tasks": unique_tasks,
+            "recent_success_rate": recent_success_rate,
+            "db_path": self.db_path
+        }
     
     def cleanup_old_records(self, days_to_keep: int = 30):
         """Clean up old records to manage database size."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Delete old execution records
-            cursor = conn.execute("""
-                DELETE FROM execution_records 
-                WHERE timestamp < datetime('now', '-{} days')
-            """.format(days_to_keep))
-            
-            deleted_executions = cursor.rowcount
-            
-            # Delete orphaned UI snapshots
-            cursor = conn.execute("""
-                DELETE FROM ui_snapshots 
-                WHERE id NOT IN (
-                    SELECT DISTINCT ui_snapshot_id FROM execution_records
-                ) AND timestamp < datetime('now', '-{} days')
-            """.format(days_to_keep))
-            
-            deleted_snapshots = cursor.rowcount
-            conn.commit()
-            
-            logger.info(f"Cleaned up {deleted_executions} execution records and {deleted_snapshots} UI snapshots")
-            
-            # Vacuum database to reclaim space
-            conn.execute("VACUUM")
-            
-            return {
-                "deleted_executions": deleted_executions,
-                "deleted_snapshots": deleted_snapshots
-            }
+        conn = self.conn
+
+        # Bound cutoff keeps the statement text constant for the
+        # prepared-statement cache; naive local time matches the
+        # isoformat timestamps we store
+        cutoff = (datetime.now() - timedelta(days=days_to_keep)).isoformat()
+
+        # Both deletes in one explicit transaction, under the store
+        # lock so no other thread's statement joins it
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Delete old execution records
+                cursor = conn.execute(
+                    "DELETE FROM execution_records WHERE timestamp < ?",
+                    (cutoff,)
+                )
+
+                deleted_executions = cursor.rowcount
+
+                # Delete orphaned UI snapshots. NOT EXISTS probes the
+                # idx_exec_snap index per candidate row instead of
+                # materializing every referenced snapshot id up front
+                cursor = conn.execute(
+                    """
+                    DELETE FROM ui_snapshots
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM execution_records e
+                        WHERE e.ui_snapshot_id = ui_snapshots.id
+                    ) AND timestamp < ?
+                    """,
+                    (cutoff,)
+                )
+
+                deleted_snapshots = cursor.rowcount
+
+                # Drop plan payloads no record references anymore; one
+                # materialized id set beats a per-plan OR anti-join here
+                conn.execute("""
+                    DELETE FROM plans
+                    WHERE id NOT IN (
+                        SELECT action_plan_id FROM execution_records
+                        UNION
+                        SELECT executed_actions_id FROM execution_records
+                    )
+                """)
+
+                # Expire memoized plans past the lookup window too;
+                # created_at is UTC, matching datetime('now')
+                conn.execute(
+                    "DELETE FROM plan_cache WHERE created_at < datetime('now', ?)",
+                    (f"-{days_to_keep} days",)
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            # Vacuum only when something was actually reclaimed; VACUUM
+            # rewrites the whole database file
+            if deleted_executions + deleted_snapshots:
+                conn.execute("VACUUM")
+
+        logger.info(f"Cleaned up {deleted_executions} execution records and {deleted_snapshots} UI snapshots")
+
+        return {
+            "deleted_executions": deleted_executions,
+            "deleted_snapshots": deleted_snapshots
+        }
+
+    def close(self):
+        """Close the persistent database connection."""
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -7,16 +7,55 @@ for desktop automation evaluation. The agent uses accessibility tree observation
 computer_13 action space for task execution.
 """
 
+import hashlib
 import json
 import logging
 import os
+import queue
+import threading
+from collections import deque
+from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
-from planner.planner import AgentlyPlanner, PlanningContext
+from memory.memory_store import MemoryStore, UISnapshot
+from planner.planner import ActionPlan, AgentlyPlanner, PlanningContext
+
+
+def _a11y_to_soa(tree: Dict) -> Dict[str, Any]:
+    """One-pass structure-of-arrays view of an accessibility tree.
+
+    Parallel lists let downstream summarizing and keyword filtering
+    scan flat arrays instead of doing a dict-lookup fanout per element
+    on every pass, and the lowercased search text is built once here
+    instead of per filter call.
+    """
+    ids, roles, labels, titles, enabled, positions, texts = [], [], [], [], [], [], []
+    for element_id, element in tree.get("elements", {}).items():
+        role = element.get("role", "unknown")
+        label = element.get("label")
+        title = element.get("title")
+        value = element.get("value")
+        ids.append(element_id)
+        roles.append(role)
+        labels.append(label)
+        titles.append(title)
+        enabled.append(bool(element.get("isEnabled", False)))
+        positions.append(element.get("position"))
+        texts.append(" ".join(filter(None, (label, title, value))).lower())
+    return {
+        "ids": ids,
+        "roles": roles,
+        "labels": labels,
+        "titles": titles,
+        "enabled": enabled,
+        "positions": positions,
+        "texts": texts,
+        "active_application": tree.get("activeApplication"),
+    }
 
 
 class AgentlyAgent:
@@ -37,6 +76,7 @@ class AgentlyAgent:
                  temperature: float = 0.1,
                  top_p: float = 1.0,
                  client_password: Optional[str] = None,
+                 memory_store: Optional[MemoryStore] = None,
                  **kwargs):
         
         # Validate OSWorld requirements
@@ -59,17 +99,58 @@ class AgentlyAgent:
             temperature=temperature,
             max_tokens=max_tokens
         )
+
+        # Plan memoization: the a11y tree often repeats across steps, and
+        # an exact (task, UI state) hit skips LLM inference entirely
+        self.memory = memory_store or MemoryStore()
         
-        # Initialize state
+        # Initialize state. Histories are bounded deques: appends stay
+        # O(1), memory stays flat over long evaluations, and only the
+        # recent tail ever reaches the planner anyway
         self.current_task = "No task set"
-        self.action_history = []
+        self.action_history = deque(maxlen=64)
         self.task_history = []
-        self.observation_history = []
+        self.observation_history = deque(maxlen=64)
         
         # Initialize logger
         self.logger = logging.getLogger(__name__)
-        
+
+        # Observation persistence stays off the critical path: predict
+        # only enqueues; this daemon thread batches snapshots into the
+        # store so SQLite write cost never sits between observation
+        # and LLM round-trip
+        self._write_q = queue.Queue()
+        self._writer = threading.Thread(target=self._drain_writes, daemon=True)
+        self._writer.start()
+
         logging.info(f"Initialized AgentlyAgent with model: {model}")
+
+    def _drain_writes(self):
+        """Writer loop: batch queued UI snapshots into the memory store.
+
+        Everything already sitting in the queue is drained into one
+        batch so the store commits them in a single transaction. A
+        None sentinel shuts the loop down after the final flush.
+        """
+        while True:
+            batch = [self._write_q.get()]
+            while True:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            snapshots = [item for item in batch if item is not None]
+            try:
+                if snapshots:
+                    self.memory.store_ui_snapshots(snapshots)
+            except Exception as e:
+                self.logger.error(f"Failed to persist UI snapshots: {e}")
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+            if stop:
+                return
     
     def predict(self, instruction: str, obs: Dict) -> Tuple[str, List[str]]:
         """
@@ -92,17 +173,52 @@ class AgentlyAgent:
                 raise ValueError("Observation must contain 'accessibility_tree'")
             
             accessibility_tree = obs["accessibility_tree"]
-            
-            # Create planning context
-            context = PlanningContext(
-                task=instruction,
+
+            # Flatten the tree once per observation; repeated predict
+            # calls on the same obs dict reuse the cached view
+            soa = obs.get("_soa")
+            if soa is None:
+                soa = obs["_soa"] = _a11y_to_soa(accessibility_tree)
+
+            # Check the plan cache before paying for inference
+            ui_checksum = self._ui_checksum(accessibility_tree)
+
+            # Hand the observation to the writer thread; batching and
+            # serialization happen there, not here
+            self._write_q.put(UISnapshot(
+                timestamp=datetime.now(),
                 ui_graph=accessibility_tree,
-                active_application=accessibility_tree.get("activeApplication"),
-                previous_actions=self.action_history
-            )
-            
-            # Generate action plan
-            plan = self.planner.generate_plan(context)
+                active_application=soa["active_application"],
+                element_count=len(soa["ids"]),
+                checksum=ui_checksum
+            ))
+            cached = self.memory.get_cached_plan(instruction, ui_checksum)
+            if cached is not None:
+                self.logger.info("Plan cache hit for current task and UI state")
+                plan = ActionPlan(**cached)
+            else:
+                # Create planning context
+                context = PlanningContext(
+                    task=instruction,
+                    ui_graph=accessibility_tree,
+                    ui_soa=soa,
+                    active_application=soa["active_application"],
+                    previous_actions=list(self.action_history)
+                )
+
+                # Generate action plan
+                plan = self.planner.generate_plan(context)
+                # Only memoize plans that actually came from the model;
+                # the planner's fallback on an LLM failure (confidence
+                # 0.0, no actions) is transient and must not be pinned
+                # for every future visit to this task and UI state
+                if plan.confidence > 0 and plan.actions:
+                    self.memory.put_cached_plan(instruction, ui_checksum, {
+                        'reasoning': plan.reasoning,
+                        'actions': plan.actions,
+                        'confidence': plan.confidence,
+                        'metadata': plan.metadata
+                    })
             
             # Extract actions from plan
             actions = plan.actions
@@ -122,6 +238,12 @@ class AgentlyAgent:
             self.logger.error(f"Error in predict: {e}")
             return f"Error: {str(e)}", []
     
+    @staticmethod
+    def _ui_checksum(accessibility_tree: Dict) -> str:
+        """Stable hash of an accessibility tree for plan-cache keying."""
+        serialized = json.dumps(accessibility_tree, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
     def reset(self, logger=None):
         """
         Reset the agent's state between tasks.
@@ -133,11 +255,15 @@ class AgentlyAgent:
             logger: Optional logger instance for debugging (can be ignored)
         """
         logging.info("Resetting AgentlyAgent state")
-        
-        # Clear all history
-        self.task_history = []
-        self.action_history = []
-        self.observation_history = []
+
+        # Flush pending observation writes so nothing from the previous
+        # task lands after state clears
+        self._write_q.join()
+
+        # Clear all history in place
+        self.task_history.clear()
+        self.action_history.clear()
+        self.observation_history.clear()
         self.current_task = None
         
         # Reset planner state if needed
@@ -145,7 +271,12 @@ class AgentlyAgent:
             self.planner.reset()
         
         logging.info("Agent state reset complete")
-    
+
+    def close(self):
+        """Flush pending writes and stop the writer thread."""
+        self._write_q.put(None)
+        self._writer.join(timeout=5)
+
     def get_state_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the agent's current state for debugging.
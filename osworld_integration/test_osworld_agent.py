@@ -4,18 +4,19 @@ Test script for AgentlyAgent OSWorld integration.
 
 This script tests the basic functionality of the AgentlyAgent class to ensure
 it properly implements the OSWorld interface requirements.
+
+Run from the repository root, e.g.:
+    python -m osworld_integration.test_osworld_agent
 """
 
+import contextlib
+import io
 import json
 import logging
-import os
 import sys
 from unittest.mock import Mock, patch, MagicMock
 
-# Add the parent directory to Python path so we can find the planner module
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-
-from osworld_agent import AgentlyAgent
+from osworld_integration.osworld_agent import AgentlyAgent
 
 
 def test_agent_initialization():
@@ -83,32 +84,31 @@ def test_agent_interface_methods():
         observation_type="a11y_tree"
     )
     
-    # Check required methods exist
-    required_methods = ['__init__', 'predict', 'reset']
-    for method_name in required_methods:
-        if hasattr(agent, method_name):
-            print(f"✓ Method '{method_name}' exists")
-        else:
-            print(f"✗ Method '{method_name}' missing")
-            return False
-    
-    # Check method signatures
-    import inspect
-    
-    # Check predict method signature
-    predict_sig = inspect.signature(agent.predict)
-    if len(predict_sig.parameters) == 2:  # instruction, obs
+    # Check required methods exist with one attribute scan
+    required_methods = {'__init__', 'predict', 'reset'}
+    missing_methods = required_methods - set(dir(agent))
+    if missing_methods:
+        print(f"✗ Methods missing: {sorted(missing_methods)}")
+        return False
+    print(f"✓ Methods {sorted(required_methods)} exist")
+
+    # Check method arity straight off the code objects: a C-level
+    # attribute read instead of building full inspect.Signature trees
+
+    # Check predict method signature (self dropped from the count)
+    predict_argcount = agent.predict.__func__.__code__.co_argcount - 1
+    if predict_argcount == 2:  # instruction, obs
         print("✓ predict method has correct signature")
     else:
-        print(f"✗ predict method has wrong signature: {predict_sig}")
+        print(f"✗ predict method has wrong signature: {predict_argcount} parameters")
         return False
-    
+
     # Check reset method signature
-    reset_sig = inspect.signature(agent.reset)
-    if len(reset_sig.parameters) == 1:  # self
+    reset_argcount = agent.reset.__func__.__code__.co_argcount - 1
+    if reset_argcount == 1:  # logger
         print("✓ reset method has correct signature")
     else:
-        print(f"✗ reset method has wrong signature: {reset_sig}")
+        print(f"✗ reset method has wrong signature: {reset_argcount} parameters")
         return False
     
     print("✓ All required interface methods implemented correctly")
@@ -258,8 +258,6 @@ def test_action_conversion():
 
 def main():
     """Run all tests."""
-    print("Running AgentlyAgent OSWorld integration tests...\n")
-    
     tests = [
         test_agent_initialization,
         test_agent_parameter_validation,
@@ -268,26 +266,33 @@ def main():
         test_agent_reset_method,
         test_action_conversion
     ]
-    
+
     passed = 0
     total = len(tests)
-    
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"✗ Test {test.__name__} failed with exception: {e}")
-    
-    print(f"\n{'='*50}")
-    print(f"Test Results: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("🎉 All tests passed! AgentlyAgent is ready for OSWorld integration.")
-        return 0
-    else:
-        print("❌ Some tests failed. Please fix the issues before using with OSWorld.")
-        return 1
+
+    # Buffer the per-test markers and emit everything with one write
+    # instead of a line-buffered stdout flush per print
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        print("Running AgentlyAgent OSWorld integration tests...\n")
+
+        for test in tests:
+            try:
+                if test():
+                    passed += 1
+            except Exception as e:
+                print(f"✗ Test {test.__name__} failed with exception: {e}")
+
+        print(f"\n{'='*50}")
+        print(f"Test Results: {passed}/{total} tests passed")
+
+        if passed == total:
+            print("🎉 All tests passed! AgentlyAgent is ready for OSWorld integration.")
+        else:
+            print("❌ Some tests failed. Please fix the issues before using with OSWorld.")
+
+    sys.stdout.write(buf.getvalue())
+    return 0 if passed == total else 1
 
 
 if __name__ == '__main__':
@@ -5,7 +5,26 @@ Provides LLM-based planning capabilities for converting natural language tasks
 into sequences of skill actions using macOS accessibility information.
 """
 
-from planner.planner import AgentlyPlanner
-from planner.prompts import PromptTemplate, SystemPrompts, TaskPrompts
+__all__ = ("AgentlyPlanner", "PromptTemplate", "SystemPrompts", "TaskPrompts")
 
-__all__ = ["AgentlyPlanner", "PromptTemplate", "SystemPrompts", "TaskPrompts"]
+# PEP 562 lazy re-exports: importing the package stays a single module
+# parse, and each submodule loads only when one of its names is first
+# touched (planner.planner pulls in the openai client, prompts builds
+# its templates at module scope)
+_LAZY = {
+    "AgentlyPlanner": "planner.planner",
+    "PromptTemplate": "planner.prompts",
+    "SystemPrompts": "planner.prompts",
+    "TaskPrompts": "planner.prompts",
+}
+
+
+def __getattr__(name):
+    target = _LAZY.get(name)
+    if target is not None:
+        from importlib import import_module
+
+        value = getattr(import_module(target), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,8 +3,12 @@ Conversation logger for LLM interactions in Agently.
 Handles detailed logging of LLM conversations to markdown files.
 """
 
+import atexit
 import json
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -12,6 +16,40 @@ from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+_last_iso_ms = 0
+_last_iso = ""
+
+
+def _fast_iso() -> str:
+    """ISO timestamp memoized per millisecond.
+
+    Stage calls for the same LLM turn usually land within the same
+    millisecond, so they reuse the formatted string instead of paying
+    for datetime construction and isoformat each time.
+    """
+    global _last_iso_ms, _last_iso
+    now = time.time()
+    ms = int(now * 1000)
+    if ms != _last_iso_ms:
+        _last_iso_ms = ms
+        _last_iso = datetime.fromtimestamp(now).isoformat()
+    return _last_iso
+
+
+# One shared template per logged message; formatting fills two slots
+# instead of rebuilding the literal around them for every message
+_MSG_TEMPLATE = "## {role} Message\n\n```\n{content}\n```\n\n"
+
+# Optional fast JSON codec for response metadata (stdlib fallback)
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 
 class ConversationLogger:
     """Handles detailed logging of LLM conversations to markdown files."""
@@ -32,6 +70,111 @@ class ConversationLogger:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.conversation_counter = 0
+        # Resolve and create the log directory once; log_conversation
+        # then skips the per-call Path build and mkdir syscalls
+        if log_dir:
+            self._conv_dir = Path(log_dir) / "llm_conversations"
+            self._conv_dir.mkdir(parents=True, exist_ok=True)
+            # Disk writes happen on a daemon thread: log_conversation
+            # only formats and enqueues, so LLM turn latency never
+            # includes file IO. atexit flushes whatever is queued.
+            self._q = queue.SimpleQueue()
+            # Open handles per log file, owned by the writer thread so
+            # a conversation's stages share one open/close pair
+            self._open_files = {}
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+            atexit.register(self._drain)
+        else:
+            self._conv_dir = None
+            self._writer = None
+            # Logging disabled (the production default): shadow the
+            # method with a no-op so each call returns without binding
+            # the message/response arguments or entering the real body
+            self.log_conversation = lambda *args, **kwargs: None
+        # Settings never change after construction, so the metadata
+        # lines of every log header are formatted once here
+        self._header_prefix = (
+            f"**Model:** {model}\n"
+            f"**Temperature:** {temperature}\n"
+            f"**Max Tokens:** {max_tokens}\n\n"
+        )
+
+    def _writer_loop(self):
+        """Writer thread: pop (filepath, mode, payload) tuples and write them.
+
+        Handles stay open across the stages of a conversation, so one
+        LLM turn costs a single open/close pair instead of one per
+        stage. A None sentinel from _drain closes everything and stops
+        the loop after all queued writes have landed.
+        """
+        while True:
+            item = self._q.get()
+            if item is None:
+                self._close_open_files()
+                return
+            filepath, mode, payload = item
+            try:
+                self._get_handle(filepath, mode).write(payload)
+            except Exception as e:
+                logger.warning(f"Failed to write LLM conversation log: {e}")
+
+    def _get_handle(self, filepath, mode):
+        """Return a cached handle for filepath, opening on first use.
+
+        A "w" item starts a new conversation log, so handles from the
+        finished conversations before it are flushed and closed there.
+        """
+        if mode == "w":
+            self._close_open_files()
+        handle = self._open_files.get(filepath)
+        if handle is None:
+            handle = self._open_files[filepath] = open(
+                filepath, mode, encoding="utf-8", buffering=65536
+            )
+        return handle
+
+    def _close_open_files(self):
+        """Flush and close every cached log handle."""
+        for handle in self._open_files.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._open_files.clear()
+
+    def _drain(self):
+        """Flush queued log writes and stop the writer thread."""
+        if self._writer is not None and self._writer.is_alive():
+            self._q.put(None)
+            self._writer.join(timeout=5)
+
+    def _header_md(self, conversation_type: str, timestamp: str) -> str:
+        """Markdown header for a conversation log."""
+        return (
+            f"# LLM Conversation: {conversation_type}\n\n"
+            f"**Timestamp:** {timestamp}\n"
+        ) + self._header_prefix
+
+    @staticmethod
+    def _messages_md(messages: List[Dict[str, str]]) -> str:
+        """Markdown for the messages sent to the LLM."""
+        return "".join(
+            _MSG_TEMPLATE.format(
+                role=message["role"].title(), content=message["content"]
+            )
+            for message in messages
+        )
+
+    @staticmethod
+    def _response_md(response: str, response_metadata: Optional[Dict]) -> str:
+        """Markdown for the response body and its metadata."""
+        metadata_md = (
+            f"**Response Metadata:**\n"
+            f"```json\n{_json_dumps(response_metadata)}\n```\n\n"
+            if response_metadata else ""
+        )
+        return f"{metadata_md}**Content:**\n```\n{response}\n```\n\n---\n\n"
     
     def log_conversation(
         self, 
@@ -53,84 +196,53 @@ class ConversationLogger:
             error: Error message if the conversation failed
             stage: Stage of conversation ("request", "response", "error", "complete")
         """
-        if not self.log_dir:
+        if self._conv_dir is None:
             return
-            
+
         try:
-            # Create conversation log directory
-            conv_dir = Path(self.log_dir) / "llm_conversations"
-            conv_dir.mkdir(parents=True, exist_ok=True)
-            
             # Create filename with counter and type
             filename = f"{self.conversation_counter:02d}_{conversation_type}.md"
-            filepath = conv_dir / filename
+            filepath = self._conv_dir / filename
             
             # Prepare conversation log content
-            timestamp = datetime.now().isoformat()
-            
+            timestamp = _fast_iso()
+
+            # Assemble the whole stage in memory, then write it with a
+            # single syscall instead of dozens of tiny f.write calls
+            parts = []
             if stage == "request":
-                # Write the initial conversation
-                with open(filepath, "w", encoding="utf-8") as f:
-                    f.write(f"# LLM Conversation: {conversation_type}\n\n")
-                    f.write(f"**Timestamp:** {timestamp}\n")
-                    f.write(f"**Model:** {self.model}\n")
-                    f.write(f"**Temperature:** {self.temperature}\n")
-                    f.write(f"**Max Tokens:** {self.max_tokens}\n\n")
-                    
-                    # Write the messages
-                    for i, message in enumerate(messages):
-                        role = message["role"].title()
-                        content = message["content"]
-                        f.write(f"## {role} Message\n\n")
-                        f.write(f"```\n{content}\n```\n\n")
-            
+                # The initial conversation
+                parts.append(self._header_md(conversation_type, timestamp))
+                parts.append(self._messages_md(messages))
+
             elif stage == "response" and response:
-                # Append the response
-                with open(filepath, "a", encoding="utf-8") as f:
-                    f.write(f"## Assistant Response\n\n")
-                    f.write(f"**Response Timestamp:** {timestamp}\n\n")
-                    
-                    if response_metadata:
-                        f.write(f"**Response Metadata:**\n")
-                        f.write(f"```json\n{json.dumps(response_metadata, indent=2)}\n```\n\n")
-                    
-                    f.write(f"**Content:**\n")
-                    f.write(f"```\n{response}\n```\n\n")
-                    f.write("---\n\n")
-            
+                # Appended after the request
+                parts.append(
+                    f"## Assistant Response\n\n"
+                    f"**Response Timestamp:** {timestamp}\n\n"
+                )
+                parts.append(self._response_md(response, response_metadata))
+
             elif stage == "error" and error:
-                with open(filepath, "a", encoding="utf-8") as f:
-                    f.write(f"## Error\n\n")
-                    f.write(f"**Error Timestamp:** {timestamp}\n")
-                    f.write(f"**Error:** {error}\n\n")
-                    f.write("---\n\n")
-            
+                parts.append(
+                    f"## Error\n\n"
+                    f"**Error Timestamp:** {timestamp}\n"
+                    f"**Error:** {error}\n\n---\n\n"
+                )
+
             elif stage == "complete" and response:
                 # Log complete conversation in one go (for backward compatibility)
-                with open(filepath, "w", encoding="utf-8") as f:
-                    f.write(f"# LLM Conversation: {conversation_type}\n\n")
-                    f.write(f"**Timestamp:** {timestamp}\n")
-                    f.write(f"**Model:** {self.model}\n")
-                    f.write(f"**Temperature:** {self.temperature}\n")
-                    f.write(f"**Max Tokens:** {self.max_tokens}\n\n")
-                    
-                    # Write the messages
-                    for i, message in enumerate(messages):
-                        role = message["role"].title()
-                        content = message["content"]
-                        f.write(f"## {role} Message\n\n")
-                        f.write(f"```\n{content}\n```\n\n")
-                    
-                    # Write response
-                    f.write(f"## Assistant Response\n\n")
-                    if response_metadata:
-                        f.write(f"**Response Metadata:**\n")
-                        f.write(f"```json\n{json.dumps(response_metadata, indent=2)}\n```\n\n")
-                    
-                    f.write(f"**Content:**\n")
-                    f.write(f"```\n{response}\n```\n\n")
-                    f.write("---\n\n")
-                    
+                parts.append(self._header_md(conversation_type, timestamp))
+                parts.append(self._messages_md(messages))
+                parts.append("## Assistant Response\n\n")
+                parts.append(self._response_md(response, response_metadata))
+
+            if not parts:
+                return
+
+            mode = "a" if stage in ("response", "error") else "w"
+            self._q.put((filepath, mode, "".join(parts)))
+
         except Exception as e:
             logger.warning(f"Failed to log LLM conversation: {e}")
     
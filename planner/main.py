@@ -9,10 +9,38 @@ import json
 import logging
 import os
 import sys
-from pathlib import Path
 
 from planner.planner import AgentlyPlanner, PlanningContext
 
+# Optional fast JSON codec (stdlib fallback). Parsing the UI graph
+# file dominates startup for large accessibility trees, and orjson
+# does it at C speed straight from bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Constant-shape error output: only the two message strings need JSON
+# escaping, so the failure path skips dict construction and a generic
+# serializer pass entirely
+_ERROR_TEMPLATE = """{
+  "reasoning": %s,
+  "actions": [],
+  "confidence": 0.0,
+  "metadata": {
+    "error": %s
+  }
+}"""
+
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
@@ -23,24 +51,23 @@ def setup_logging(verbose: bool = False):
     )
 
 
-def load_ui_graph(graph_path: str) -> dict:
-    """Load UI graph from JSON file."""
-    with open(graph_path, 'r') as f:
-        return json.load(f)
-
-
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description='Agently Planner')
     parser.add_argument('--task', required=True, help='Task description')
-    parser.add_argument('--graph', required=True, help='Path to UI graph JSON file')
+    # FileType opens at parse time: bad paths fail with argparse's own
+    # error reporting, and the handles go straight to the JSON parser
+    parser.add_argument('--graph', required=True, type=argparse.FileType('rb'),
+                        help='Path to UI graph JSON file')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
     parser.add_argument('--recovery', action='store_true', help='Recovery planning mode')
     parser.add_argument('--failed-action', help='Failed action data (JSON, deprecated)')
-    parser.add_argument('--failed-action-file', help='Path to JSON file containing the failed action')
+    parser.add_argument('--failed-action-file', type=argparse.FileType('rb'),
+                        help='Path to JSON file containing the failed action')
     parser.add_argument('--error-message', help='Error message from failed action')
     parser.add_argument('--completed-actions', help='Completed actions data (JSON, deprecated)')
-    parser.add_argument('--completed-actions-file', help='Path to JSON file containing completed actions')
+    parser.add_argument('--completed-actions-file', type=argparse.FileType('rb'),
+                        help='Path to JSON file containing completed actions')
     parser.add_argument('--log-dir', help='Directory to save LLM conversation logs')
     parser.add_argument('--enable-llm-logging', action='store_true', help='Enable detailed LLM conversation logging (may slow down execution)')
     
@@ -50,8 +77,9 @@ def main():
     logger = logging.getLogger(__name__)
     
     try:
-        # Load UI graph
-        ui_graph = load_ui_graph(args.graph)
+        # Load UI graph from the handle argparse already opened
+        ui_graph = _json_loads(args.graph.read())
+        args.graph.close()
         
         # Initialize planner
         api_key = os.getenv('OPENAI_API_KEY')
@@ -76,20 +104,20 @@ def main():
             
             # Handle failed action (file takes precedence over direct argument)
             if args.failed_action_file:
-                with open(args.failed_action_file, 'r') as f:
-                    error_context['failed_action'] = json.load(f)
+                error_context['failed_action'] = _json_loads(args.failed_action_file.read())
+                args.failed_action_file.close()
             elif args.failed_action:
-                error_context['failed_action'] = json.loads(args.failed_action)
+                error_context['failed_action'] = _json_loads(args.failed_action)
             
             if args.error_message:
                 error_context['error_message'] = args.error_message
             
             # Handle completed actions (file takes precedence over direct argument)
             if args.completed_actions_file:
-                with open(args.completed_actions_file, 'r') as f:
-                    context.previous_actions = json.load(f)
+                context.previous_actions = _json_loads(args.completed_actions_file.read())
+                args.completed_actions_file.close()
             elif args.completed_actions:
-                context.previous_actions = json.loads(args.completed_actions)
+                context.previous_actions = _json_loads(args.completed_actions)
             
             context.error_context = error_context
             plan = planner.recover_from_error(context)
@@ -105,18 +133,15 @@ def main():
             'metadata': plan.metadata or {}
         }
         
-        print(json.dumps(result, indent=2))
-        
+        print(_json_dumps(result))
+
     except Exception as e:
         logger.error(f"Planning failed: {e}")
         # Output error in expected format
-        error_result = {
-            'reasoning': f"Planning failed: {str(e)}",
-            'actions': [],
-            'confidence': 0.0,
-            'metadata': {'error': str(e)}
-        }
-        print(json.dumps(error_result, indent=2))
+        error = str(e)
+        print(_ERROR_TEMPLATE % (
+            json.dumps(f"Planning failed: {error}"), json.dumps(error)
+        ))
         sys.exit(1)
 
 
@@ -2,25 +2,126 @@
 Main planner implementation for Agently.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
-from dataclasses import dataclass
+import re
+import time
+from collections import Counter, OrderedDict, deque
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+import httpx
 import openai
 from openai import OpenAI
+from pydantic import BaseModel, ValidationError
 
 from planner.prompts import SystemPrompts, TaskPrompts
 from planner.conversation_logger import ConversationLogger
 
+# Optional numpy for the intent-embedding cache in select_element
+# (pure-Python dot product fallback)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional fast JSON codec for parsing LLM responses (stdlib fallback).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+# error handling sees the same exception type either way.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
+# Cache bucket for OpenAI server-side prompt caching; bump the suffix
+# when the system prompt changes shape
+_PROMPT_CACHE_KEY = "agently-main-v1"
+
+# Response-cleaning patterns, compiled once. The comment stripper
+# matches string literals first so a // inside a quoted value (say a
+# URL) survives, and only real line/block comments are dropped — one
+# pass through the C regex engine instead of a Python character scan.
+_COMMENT_RE = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_JSON_BODY_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _drop_comment(match: "re.Match") -> str:
+    text = match.group(0)
+    return text if text.startswith('"') else ''
+
+
+# Roles surfaced as "key interactive elements" in UI graph summaries
+_NOTABLE_ROLES = frozenset({"AXButton", "AXTextField", "AXMenuButton"})
+
+# Process-wide connection pools shared by every planner instance.
+# Worker pools and test harnesses build several planners; without this
+# each one opened its own httpx client and re-paid TLS handshakes.
+# Timeouts mirror the openai SDK's own defaults, and HTTP/2 (which
+# multiplexes concurrent batch requests over one connection) is used
+# when the optional h2 package is installed.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+_shared_http_client: Optional[httpx.Client] = None
+# Async pools are keyed by event loop: connections belong to the loop
+# they were opened on, so a single process-wide client would hand any
+# later asyncio.run connections bound to an already-closed loop
+_shared_async_http_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _shared_http_pool() -> httpx.Client:
+    global _shared_http_client
+    if _shared_http_client is None:
+        try:
+            _shared_http_client = httpx.Client(
+                http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+            )
+        except ImportError:
+            _shared_http_client = httpx.Client(
+                limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+            )
+    return _shared_http_client
+
+
+def _shared_async_http_pool() -> httpx.AsyncClient:
+    """Shared AsyncClient for the running event loop.
+
+    Sharing across planner instances on the same loop keeps the TLS
+    reuse; sharing across loops would serve dead connections.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_async_http_clients.get(loop)
+    if client is None:
+        try:
+            client = httpx.AsyncClient(
+                http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+            )
+        except ImportError:
+            client = httpx.AsyncClient(
+                limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+            )
+        _shared_async_http_clients[loop] = client
+    return client
+
 
-@dataclass
+async def _close_async_http_pool():
+    """Close and discard the running loop's shared AsyncClient, if any."""
+    client = _shared_async_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@dataclass(slots=True)
 class PlanningContext:
     """Context information for planning."""
     
@@ -29,13 +130,17 @@ class PlanningContext:
     active_application: Optional[str] = None
     previous_actions: List[Dict[str, Any]] = None
     error_context: Optional[Dict[str, Any]] = None
+    # Optional structure-of-arrays view of ui_graph (parallel lists of
+    # ids/roles/labels/titles/enabled/positions/texts); lets the prompt
+    # helpers scan flat lists instead of per-element dicts
+    ui_soa: Optional[Dict[str, Any]] = None
     
     def __post_init__(self):
         if self.previous_actions is None:
             self.previous_actions = []
 
 
-@dataclass 
+@dataclass(slots=True)
 class ActionPlan:
     """Generated action plan."""
     
@@ -45,6 +150,33 @@ class ActionPlan:
     metadata: Optional[Dict[str, Any]] = None
 
 
+# Response schemas: one model_validate call replaces the scattered
+# .get() defaults after each JSON parse, coercing types and rejecting
+# malformed shapes in pydantic's Rust core. Actions stay List[Any]
+# because plans mix dict actions with computer_13 strings, which a
+# strict server-side schema cannot express.
+class PlanResponse(BaseModel):
+    """Shape of a plan-generation response."""
+
+    reasoning: str = ""
+    actions: List[Any] = []
+    confidence: float = 0.5
+
+
+class RecoveryResponse(BaseModel):
+    """Shape of an error-recovery response."""
+
+    recovery_strategy: str = ""
+    actions: List[Any] = []
+
+
+class SelectionResponse(BaseModel):
+    """Shape of an element-selection response."""
+
+    element_id: Optional[str] = None
+    reasoning: str = ""
+
+
 class AgentlyPlanner:
     """LLM-based planner for generating action sequences."""
     
@@ -54,12 +186,66 @@ class AgentlyPlanner:
         api_key: Optional[str] = None,
         temperature: float = 0.1,
         max_tokens: int = 2000,
-        log_dir: Optional[str] = None
+        log_dir: Optional[str] = None,
+        cache_ttl: float = 300.0,
+        max_cache_entries: int = 128,
+        cache_path: Optional[str] = None,
+        stream: bool = False,
+        http_client: Optional[httpx.Client] = None,
+        selection_model: Optional[str] = None,
+        selection_service_tier: Optional[str] = None
     ):
         self.model = model
+        # select_element is a low-stakes pick-from-a-list classification
+        # that runs many times per executed plan, so it can point at a
+        # smaller model (e.g. gpt-4.1-nano) and a cheaper service tier
+        # ("flex", on models that support it) without touching the
+        # planning model. Defaults keep today's behavior.
+        self.selection_model = selection_model or model
+        self.selection_service_tier = selection_service_tier
         self.temperature = temperature
         self.max_tokens = max_tokens
-        
+        # Stream completions token-by-token instead of waiting for the
+        # full response body; cuts time-to-first-byte on long plans
+        self.stream = stream
+
+        # In-process plan cache keyed by task + UI signature. The LLM
+        # round-trip dominates generate_plan by orders of magnitude,
+        # and repeated (task, UI state) pairs re-issue identical
+        # plans, so hits skip the network entirely. Entries expire
+        # after cache_ttl seconds and evict LRU past max_cache_entries.
+        self.cache_ttl = cache_ttl
+        self._max_cache_entries = max_cache_entries
+        self._plan_cache: OrderedDict = OrderedDict()
+
+        # Optional on-disk checkpoint of the plan cache: each stored
+        # plan is appended as one JSONL row, and a later run given the
+        # same path reloads them so a crashed or restarted session
+        # does not re-pay LLM calls for plans it already generated
+        self._cache_fd = None
+        self._cache_writes = 0
+        if cache_path is not None:
+            self._cache_path = Path(cache_path)
+            self._load_plan_cache()
+            self._cache_fd = os.open(
+                self._cache_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+
+        # Semantic cache for select_element: recurring intents ("click
+        # Submit") hit an embedding similarity lookup instead of the
+        # chat model. Entries are (intent vector, element-id signature,
+        # selected id); a hit requires both high cosine similarity and
+        # the same candidate id-set, so a similar intent against a
+        # different screen never replays a stale selection.
+        self._intent_cache: deque = deque(maxlen=1024)
+        self._intent_sim_threshold = 0.92
+
+        # Format the static system prompt once. Every request starts
+        # with the same byte-identical prefix, which is what OpenAI's
+        # server-side prompt cache keys on, so repeated calls get the
+        # discounted cached-prefix rate and faster time-to-first-token.
+        self._system_prompt = SystemPrompts.MAIN_SYSTEM.format()
+
         # Initialize conversation logger
         self.conversation_logger = ConversationLogger(
             log_dir=log_dir,
@@ -68,82 +254,220 @@ class AgentlyPlanner:
             max_tokens=max_tokens
         )
         
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(
+            api_key=api_key, http_client=http_client or _shared_http_pool()
+        )
+        # Async counterpart, built lazily on first batch call so the
+        # common synchronous path never touches asyncio; cached per
+        # event loop alongside the loop it was built on
+        self._api_key = api_key
+        self._async_client = None
+        self._async_client_loop = None
         logger.info(f"Initialized planner with model: {model}")
+
+    def _get_async_client(self):
+        # The client embeds a loop-bound connection pool, so a cached
+        # instance must not outlive the loop it was built on; rebuild
+        # when called from a different loop (e.g. a later asyncio.run)
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = openai.AsyncOpenAI(
+                api_key=self._api_key, http_client=_shared_async_http_pool()
+            )
+            self._async_client_loop = loop
+        return self._async_client
     
+    def _plan_cache_key(self, context: PlanningContext) -> str:
+        """Cache key from the normalized task and a UI-state signature."""
+        if context.ui_soa is not None:
+            signature = sorted(
+                (role, label or "")
+                for role, label in zip(context.ui_soa["roles"], context.ui_soa["labels"])
+            )
+        else:
+            signature = sorted(
+                (element.get("role", ""), element.get("label") or "")
+                for element in context.ui_graph.get("elements", {}).values()
+            )
+        key = f"{context.task.strip().lower()}|{signature}"
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _cache_lookup(self, key: str) -> Optional[ActionPlan]:
+        """Return a cached plan if present and fresh, refreshing its LRU slot."""
+        entry = self._plan_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, plan = entry
+        if time.monotonic() - stored_at > self.cache_ttl:
+            del self._plan_cache[key]
+            return None
+        self._plan_cache.move_to_end(key)
+        return plan
+
+    def _cache_store(self, key: str, plan: ActionPlan):
+        """Store a plan, evicting least-recently-used entries past the cap."""
+        cache = self._plan_cache
+        cache[key] = (time.monotonic(), plan)
+        cache.move_to_end(key)
+        while len(cache) > self._max_cache_entries:
+            cache.popitem(last=False)
+        if self._cache_fd is not None:
+            self._checkpoint(key, plan)
+
+    def _load_plan_cache(self):
+        """Reload checkpointed plans from the cache file, if it exists.
+
+        Entries get a fresh TTL window on load; their original wall
+        times are meaningless against the new process's monotonic
+        clock. A torn final line from a crash mid-write is skipped.
+        """
+        try:
+            handle = open(self._cache_path, "rb")
+        except FileNotFoundError:
+            return
+        now = time.monotonic()
+        with handle:
+            for line in handle:
+                try:
+                    entry = _json_loads(line)
+                    plan = ActionPlan(**entry["plan"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                self._plan_cache[entry["key"]] = (now, plan)
+        while len(self._plan_cache) > self._max_cache_entries:
+            self._plan_cache.popitem(last=False)
+        logger.info(f"Loaded {len(self._plan_cache)} cached plans from {self._cache_path}")
+
+    def _checkpoint(self, key: str, plan: ActionPlan):
+        """Append one cache entry to the checkpoint file.
+
+        O_APPEND keeps each row write atomic, and fsync runs only every
+        32 entries so checkpointing stays off the planning hot path.
+        """
+        try:
+            line = json.dumps({"key": key, "plan": asdict(plan)}) + "\n"
+            os.write(self._cache_fd, line.encode())
+            self._cache_writes += 1
+            if self._cache_writes % 32 == 0:
+                os.fsync(self._cache_fd)
+        except OSError as e:
+            logger.warning(f"Failed to checkpoint plan cache: {e}")
+
+    def _intent_vector(self, intent: str):
+        """Embed an intent with text-embedding-3-small.
+
+        OpenAI embeddings come back unit-normalized, so cosine
+        similarity downstream is a plain dot product.
+        """
+        response = self.client.embeddings.create(
+            model="text-embedding-3-small",
+            input=intent
+        )
+        vector = response.data[0].embedding
+        return np.asarray(vector) if np is not None else vector
+
+    @staticmethod
+    def _intent_similarity(a, b) -> float:
+        """Dot product of two unit vectors (their cosine similarity)."""
+        if np is not None:
+            return float(a @ b)
+        return sum(x * y for x, y in zip(a, b))
+
     def _clean_json_response(self, response: str) -> str:
         """Clean and prepare JSON response for parsing."""
         if not response or not response.strip():
             raise ValueError("Empty response from LLM")
         
-        # Strip markdown code blocks if present
+        # Strip markdown code fences if present; unfenced responses
+        # (the common case) skip the extra strip allocation entirely
         clean_response = response.strip()
-        if clean_response.startswith('```json'):
-            clean_response = clean_response[7:]  # Remove '```json'
-        if clean_response.startswith('```'):
-            clean_response = clean_response[3:]   # Remove '```'
-        if clean_response.endswith('```'):
-            clean_response = clean_response[:-3]  # Remove trailing '```'
-        clean_response = clean_response.strip()
-        
-        # Remove any JavaScript-style comments that might have been generated
-        import re
-        clean_response = re.sub(r'//.*$', '', clean_response, flags=re.MULTILINE)
-        clean_response = re.sub(r'/\*.*?\*/', '', clean_response, flags=re.DOTALL)
+        if clean_response.startswith('```') or clean_response.endswith('```'):
+            clean_response = clean_response.removeprefix('```json')
+            clean_response = clean_response.removeprefix('```')
+            clean_response = clean_response.removesuffix('```')
+            clean_response = clean_response.strip()
         
+        # Remove any JavaScript-style comments that might have been
+        # generated. Most responses have none, and the substring check
+        # is far cheaper than running the pattern over the whole payload
+        if '//' in clean_response or '/*' in clean_response:
+            clean_response = _COMMENT_RE.sub(_drop_comment, clean_response)
+
         # Remove trailing commas before closing brackets/braces
-        clean_response = re.sub(r',(\s*[}\]])', r'\1', clean_response)
-        
+        clean_response = _TRAILING_COMMA_RE.sub(r'\1', clean_response)
+
         # Try to find JSON content if the response contains extra text
         # Look for content between { and } that looks like JSON
-        json_match = re.search(r'\{.*\}', clean_response, flags=re.DOTALL)
+        json_match = _JSON_BODY_RE.search(clean_response)
         if json_match:
             clean_response = json_match.group(0)
         
         return clean_response
 
+    def _parse_llm_json(self, response: str) -> Dict[str, Any]:
+        """Parse an LLM JSON response.
+
+        JSON mode means responses normally parse as-is; the markdown
+        and comment cleanup only runs as a fallback when the direct
+        parse fails (a mock, an older model, or json_mode=False).
+        """
+        try:
+            return _json_loads(response)
+        except ValueError:
+            return _json_loads(self._clean_json_response(response))
+
+    def _build_plan_prompt(self, context: PlanningContext) -> str:
+        """Build the planning user prompt for a context."""
+        # Analyze UI graph and extract relevant information
+        ui_summary, relevant_elements = self._analyze_ui(
+            context.ui_graph, context.task, context.ui_soa
+        )
+
+        return TaskPrompts.PLAN_GENERATION.format(
+            task=context.task,
+            ui_graph_summary=ui_summary,
+            relevant_elements=relevant_elements
+        )
+
+    def _parse_plan_response(self, response: str) -> ActionPlan:
+        """Parse and validate an LLM planning response."""
+        try:
+            plan_data = PlanResponse.model_validate(self._parse_llm_json(response))
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON decode error: {e}")
+            logger.error(f"Original response: {repr(response)}")
+            raise ValueError(f"Invalid JSON response: {e}")
+        except ValidationError as e:
+            logger.error(f"Plan failed schema validation: {e}")
+            raise ValueError(f"Invalid plan response: {e}")
+        return ActionPlan(
+            reasoning=plan_data.reasoning,
+            actions=plan_data.actions,
+            confidence=plan_data.confidence
+        )
+
     def generate_plan(self, context: PlanningContext) -> ActionPlan:
         """Generate an action plan for the given context."""
         logger.info(f"Generating plan for task: {context.task}")
-        
+
+        cache_key = self._plan_cache_key(context)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            logger.info("Plan cache hit; skipping LLM call")
+            return cached
+
         try:
-            # Analyze UI graph and extract relevant information
-            ui_summary = self._summarize_ui_graph(context.ui_graph)
-            relevant_elements = self._find_relevant_elements(context.ui_graph, context.task)
-            
-            # Build the planning prompt
-            user_prompt = TaskPrompts.PLAN_GENERATION.format(
-                task=context.task,
-                ui_graph_summary=ui_summary,
-                relevant_elements=relevant_elements
-            )
-            
-            # Generate plan using LLM
             response = self._call_llm(
-                system_prompt=SystemPrompts.MAIN_SYSTEM.format(),
-                user_prompt=user_prompt,
+                system_prompt=self._system_prompt,
+                user_prompt=self._build_plan_prompt(context),
                 conversation_type="initial_planning"
             )
-            
-            # Parse and validate response
-            try:
-                clean_response = self._clean_json_response(response)
-                logger.debug(f"Cleaned response: {repr(clean_response)}")
-                plan_data = json.loads(clean_response)
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-                logger.error(f"Original response: {repr(response)}")
-                logger.error(f"Cleaned response: {repr(clean_response)}")
-                raise ValueError(f"Invalid JSON response: {e}")
-            plan = ActionPlan(
-                reasoning=plan_data.get("reasoning", ""),
-                actions=plan_data.get("actions", []),
-                confidence=plan_data.get("confidence", 0.5)
-            )
-            
+            plan = self._parse_plan_response(response)
+
             logger.info(f"Generated plan with {len(plan.actions)} actions, confidence: {plan.confidence}")
+            self._cache_store(cache_key, plan)
             return plan
-            
+
         except Exception as e:
             logger.error(f"Failed to generate plan: {e}")
             # Return fallback plan
@@ -152,7 +476,71 @@ class AgentlyPlanner:
                 actions=[],
                 confidence=0.0
             )
-    
+
+    async def generate_plan_async(self, context: PlanningContext) -> ActionPlan:
+        """Async variant of generate_plan, sharing its cache and prompts."""
+        logger.info(f"Generating plan for task: {context.task}")
+
+        cache_key = self._plan_cache_key(context)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            logger.info("Plan cache hit; skipping LLM call")
+            return cached
+
+        try:
+            response = await self._call_llm_async(
+                system_prompt=self._system_prompt,
+                user_prompt=self._build_plan_prompt(context),
+                conversation_type="initial_planning"
+            )
+            plan = self._parse_plan_response(response)
+
+            logger.info(f"Generated plan with {len(plan.actions)} actions, confidence: {plan.confidence}")
+            self._cache_store(cache_key, plan)
+            return plan
+
+        except Exception as e:
+            logger.error(f"Failed to generate plan: {e}")
+            return ActionPlan(
+                reasoning=f"Error in planning: {str(e)}",
+                actions=[],
+                confidence=0.0
+            )
+
+    async def generate_plans_batch(
+        self, contexts: List[PlanningContext], max_inflight: int = 4
+    ) -> List[ActionPlan]:
+        """Generate plans for several independent contexts concurrently.
+
+        The LLM calls overlap on the event loop instead of running
+        serially, with a semaphore bounding in-flight requests so a
+        large batch stays inside API rate limits. Results come back in
+        input order.
+        """
+        semaphore = asyncio.Semaphore(max_inflight)
+
+        async def bounded(ctx: PlanningContext) -> ActionPlan:
+            async with semaphore:
+                return await self.generate_plan_async(ctx)
+
+        return list(await asyncio.gather(*(bounded(ctx) for ctx in contexts)))
+
+    def generate_plans(
+        self, contexts: List[PlanningContext], max_inflight: int = 4
+    ) -> List[ActionPlan]:
+        """Synchronous wrapper around generate_plans_batch."""
+
+        async def run() -> List[ActionPlan]:
+            # The loop this call creates dies on return, so close the
+            # loop's shared connection pool before then instead of
+            # orphaning its keep-alive sockets
+            try:
+                return await self.generate_plans_batch(contexts, max_inflight)
+            finally:
+                await _close_async_http_pool()
+
+        return asyncio.run(run())
+
     def recover_from_error(self, context: PlanningContext) -> ActionPlan:
         """Generate a recovery plan when an action fails."""
         logger.info("Generating error recovery plan")
@@ -162,7 +550,7 @@ class AgentlyPlanner:
             return self.generate_plan(context)
         
         try:
-            current_ui_summary = self._summarize_ui_graph(context.ui_graph)
+            current_ui_summary = self._summarize_ui_graph(context.ui_graph, context.ui_soa)
             available_elements = self._extract_interactive_elements(context.ui_graph)
             
             user_prompt = TaskPrompts.ERROR_RECOVERY.format(
@@ -175,14 +563,13 @@ class AgentlyPlanner:
             )
             
             response = self._call_llm(
-                system_prompt=SystemPrompts.MAIN_SYSTEM.format(),
+                system_prompt=self._system_prompt,
                 user_prompt=user_prompt,
                 conversation_type="error_recovery"
             )
             
             try:
-                clean_response = self._clean_json_response(response)
-                recovery_data = json.loads(clean_response)
+                recovery_data = RecoveryResponse.model_validate(self._parse_llm_json(response))
             except Exception as e:
                 logger.error(f"Failed to parse recovery response: {e}")
                 return ActionPlan(
@@ -190,10 +577,10 @@ class AgentlyPlanner:
                     actions=[],
                     confidence=0.0
                 )
-            
+
             return ActionPlan(
-                reasoning=recovery_data.get("recovery_strategy", ""),
-                actions=recovery_data.get("actions", []),
+                reasoning=recovery_data.recovery_strategy,
+                actions=recovery_data.actions,
                 confidence=0.7,  # Lower confidence for recovery plans
                 metadata={"is_recovery": True}
             )
@@ -211,6 +598,33 @@ class AgentlyPlanner:
         logger.debug(f"Selecting element for intent: {intent}")
         
         try:
+            # Semantic cache lookup: the embedding call is far cheaper
+            # than a chat completion, and repeated intents against the
+            # same candidate set ("click Submit") are common. Matching
+            # the element-id signature guards against a similar intent
+            # resolving to a different screen's elements.
+            signature = frozenset(element.get("id") for element in elements)
+            vector = None
+            try:
+                vector = self._intent_vector(intent)
+                best_sim = -1.0
+                best_id = None
+                for cached_vector, cached_signature, cached_id in self._intent_cache:
+                    if cached_signature != signature:
+                        continue
+                    similarity = self._intent_similarity(vector, cached_vector)
+                    if similarity > best_sim:
+                        best_sim = similarity
+                        best_id = cached_id
+                if best_sim > self._intent_sim_threshold:
+                    logger.debug(
+                        f"Semantic cache hit (similarity {best_sim:.3f}): {best_id}"
+                    )
+                    return best_id
+            except Exception as e:
+                # Embedding failures fall through to the normal LLM path
+                logger.debug(f"Intent embedding lookup failed: {e}")
+
             elements_summary = self._format_elements_for_selection(elements)
             
             user_prompt = TaskPrompts.ELEMENT_SELECTION.format(
@@ -219,35 +633,29 @@ class AgentlyPlanner:
             )
             
             response = self._call_llm(
-                system_prompt=SystemPrompts.MAIN_SYSTEM.format(),
+                system_prompt=self._system_prompt,
                 user_prompt=user_prompt,
-                conversation_type="element_selection"
+                conversation_type="element_selection",
+                model=self.selection_model,
+                service_tier=self.selection_service_tier
             )
             
-            if not response or not response.strip():
-                raise ValueError("Empty response from LLM")
-            
-            # Strip markdown code blocks if present
-            clean_response = response.strip()
-            if clean_response.startswith('```json'):
-                clean_response = clean_response[7:]
-            if clean_response.startswith('```'):
-                clean_response = clean_response[3:]
-            if clean_response.endswith('```'):
-                clean_response = clean_response[:-3]
-            clean_response = clean_response.strip()
-            
-            selection_data = json.loads(clean_response)
-            element_id = selection_data.get("element_id")
-            
-            logger.debug(f"Selected element: {element_id}, reasoning: {selection_data.get('reasoning')}")
+            selection_data = SelectionResponse.model_validate(self._parse_llm_json(response))
+            element_id = selection_data.element_id
+
+            if vector is not None and element_id is not None:
+                self._intent_cache.append((vector, signature, element_id))
+
+            logger.debug(f"Selected element: {element_id}, reasoning: {selection_data.reasoning}")
             return element_id
             
         except Exception as e:
             logger.error(f"Failed to select element: {e}")
             return None
     
-    def _call_llm(self, system_prompt: str, user_prompt: str, conversation_type: str = "planning") -> str:
+    def _call_llm(self, system_prompt: str, user_prompt: str, conversation_type: str = "planning",
+                  json_mode: bool = True, model: Optional[str] = None,
+                  service_tier: Optional[str] = None) -> str:
         """Make a call to the LLM API with detailed logging."""
         try:
             # Increment conversation counter
@@ -266,36 +674,42 @@ class AgentlyPlanner:
                 stage="request"
             )
             
-            # Make API call
-            response = self.client.chat.completions.create(
-                model=self.model,
+            # Make API call. The prompt_cache_key pins all planner
+            # requests to one server-side cache bucket so the shared
+            # system-prompt prefix stays hot across conversation types,
+            # and JSON mode keeps responses free of markdown fences
+            # and comments the parser would otherwise strip.
+            request_kwargs: Dict[str, Any] = dict(
+                model=model or self.model,
                 messages=messages,
                 temperature=self.temperature,
-                max_tokens=self.max_tokens
+                max_tokens=self.max_tokens,
+                extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY}
             )
-            
-            content = response.choices[0].message.content
-            
+            if json_mode:
+                request_kwargs["response_format"] = {"type": "json_object"}
+            if service_tier:
+                request_kwargs["service_tier"] = service_tier
+
+            if self.stream:
+                content, response_metadata = self._consume_stream(request_kwargs)
+            else:
+                response = self.client.chat.completions.create(**request_kwargs)
+                content = response.choices[0].message.content
+                response_metadata = self._response_metadata(response)
+
             # Log the response
             self.conversation_logger.log_conversation(
                 conversation_type=conversation_type,
                 messages=messages,
                 response=content,
-                response_metadata={
-                    "model": response.model,
-                    "usage": {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens
-                    } if response.usage else None,
-                    "finish_reason": response.choices[0].finish_reason
-                },
+                response_metadata=response_metadata,
                 stage="response"
             )
-            
+
             logger.debug(f"LLM response: {content}")
             return content
-            
+
         except Exception as e:
             # Log the error
             self.conversation_logger.log_conversation(
@@ -306,53 +720,202 @@ class AgentlyPlanner:
             )
             logger.error(f"LLM API call failed: {e}")
             raise
-    
-    def _summarize_ui_graph(self, ui_graph: Dict[str, Any]) -> str:
+
+    async def _call_llm_async(self, system_prompt: str, user_prompt: str, conversation_type: str = "planning",
+                              json_mode: bool = True) -> str:
+        """Async counterpart of _call_llm on the shared AsyncOpenAI client."""
+        try:
+            self.conversation_logger.increment_counter()
+
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+
+            self.conversation_logger.log_conversation(
+                conversation_type=conversation_type,
+                messages=messages,
+                stage="request"
+            )
+
+            request_kwargs: Dict[str, Any] = dict(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY}
+            )
+            if json_mode:
+                request_kwargs["response_format"] = {"type": "json_object"}
+            response = await self._get_async_client().chat.completions.create(**request_kwargs)
+
+            content = response.choices[0].message.content
+
+            self.conversation_logger.log_conversation(
+                conversation_type=conversation_type,
+                messages=messages,
+                response=content,
+                response_metadata=self._response_metadata(response),
+                stage="response"
+            )
+
+            logger.debug(f"LLM response: {content}")
+            return content
+
+        except Exception as e:
+            self.conversation_logger.log_conversation(
+                conversation_type=conversation_type,
+                messages=messages if 'messages' in locals() else [],
+                error=str(e),
+                stage="error"
+            )
+            logger.error(f"LLM API call failed: {e}")
+            raise
+
+    def _consume_stream(self, request_kwargs: Dict[str, Any]) -> tuple:
+        """Stream a completion and return (content, response_metadata).
+
+        Consuming deltas as they arrive overlaps download with token
+        generation, so the response is fully in hand almost as soon as
+        the model emits its last token instead of after a final
+        whole-body read. include_usage keeps the token accounting that
+        conversation logging records.
+        """
+        stream = self.client.chat.completions.create(
+            stream=True,
+            stream_options={"include_usage": True},
+            **request_kwargs
+        )
+        parts = []
+        model = self.model
+        usage = None
+        finish_reason = None
+        with stream:
+            for chunk in stream:
+                model = getattr(chunk, "model", None) or model
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                if choice.delta.content:
+                    parts.append(choice.delta.content)
+        metadata = {
+            "model": model,
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens
+            } if usage else None,
+            "finish_reason": finish_reason
+        }
+        return "".join(parts), metadata
+
+    @staticmethod
+    def _response_metadata(response) -> Dict[str, Any]:
+        """Response metadata dict for conversation logging."""
+        return {
+            "model": response.model,
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+                "total_tokens": response.usage.total_tokens
+            } if response.usage else None,
+            "finish_reason": response.choices[0].finish_reason
+        }
+
+    def _summarize_ui_graph(self, ui_graph: Dict[str, Any],
+                            ui_soa: Optional[Dict[str, Any]] = None) -> str:
         """Create a concise summary of the UI graph."""
-        elements = ui_graph.get("elements", {})
-        active_app = ui_graph.get("activeApplication")
-        
-        # Count elements by role
-        role_counts = {}
-        for element in elements.values():
-            role = element.get("role", "unknown")
-            role_counts[role] = role_counts.get(role, 0) + 1
-        
-        # Find notable elements
-        notable_elements = []
-        for element in elements.values():
-            if element.get("role") in ["AXButton", "AXTextField", "AXMenuButton"]:
-                label = element.get("label") or element.get("title") or "unlabeled"
-                notable_elements.append(f"{element.get('role')} '{label}'")
-        
-        summary = f"Application: {active_app or 'Unknown'}\\n"
-        summary += f"Total elements: {len(elements)}\\n"
-        summary += f"Element types: {dict(role_counts)}\\n"
-        
+        if ui_soa is not None:
+            # Flat-list scan over the precomputed view; Counter does
+            # the role tally in one C-level pass
+            active_app = ui_soa["active_application"]
+            roles = ui_soa["roles"]
+            element_count = len(roles)
+            role_counts = Counter(roles)
+            notable_elements = []
+            for role, label, title in zip(roles, ui_soa["labels"], ui_soa["titles"]):
+                if role in _NOTABLE_ROLES:
+                    notable_elements.append(f"{role} '{label or title or 'unlabeled'}'")
+                    if len(notable_elements) == 10:
+                        break
+        else:
+            elements = ui_graph.get("elements", {})
+            active_app = ui_graph.get("activeApplication")
+            element_count = len(elements)
+
+            # One traversal counts roles and collects the first ten
+            # notable elements; only ten ever make the summary, so
+            # collection stops contributing once the list is full
+            role_counts = Counter()
+            notable_elements = []
+            for element in elements.values():
+                role = element.get("role", "unknown")
+                role_counts[role] += 1
+                if len(notable_elements) < 10 and role in _NOTABLE_ROLES:
+                    label = element.get("label") or element.get("title") or "unlabeled"
+                    notable_elements.append(f"{role} '{label}'")
+
+        summary = (
+            f"Application: {active_app or 'Unknown'}\\n"
+            f"Total elements: {element_count}\\n"
+            f"Element types: {dict(role_counts)}\\n"
+        )
+
         if notable_elements:
-            summary += f"Key interactive elements: {notable_elements[:10]}"  # Limit to first 10
-        
+            summary += f"Key interactive elements: {notable_elements}"
+
         return summary
     
-    def _find_relevant_elements(self, ui_graph: Dict[str, Any], task: str) -> str:
+    def _find_relevant_elements(self, ui_graph: Dict[str, Any], task: str,
+                                ui_soa: Optional[Dict[str, Any]] = None) -> str:
         """Find elements relevant to the current task."""
-        elements = ui_graph.get("elements", {})
-        task_lower = task.lower()
-        
+        keywords = [word for word in task.lower().split() if len(word) > 2]
+        if not keywords:
+            return json.dumps([], indent=2)
+
+        # One alternation pattern replaces the per-element
+        # any(word in text) loop: each element costs a single C-level
+        # scan instead of one Python substring search per task word
+        pattern = re.compile("|".join(map(re.escape, keywords)))
+
         relevant = []
-        
+
+        if ui_soa is not None:
+            # The view carries pre-lowered search text, so matching is
+            # one pattern scan per element with no joins or dict lookups
+            for element_id, role, label, title, enabled, text in zip(
+                ui_soa["ids"], ui_soa["roles"], ui_soa["labels"],
+                ui_soa["titles"], ui_soa["enabled"], ui_soa["texts"]
+            ):
+                if pattern.search(text):
+                    relevant.append({
+                        "id": element_id,
+                        "role": role,
+                        "label": label,
+                        "title": title,
+                        "enabled": enabled
+                    })
+                    # Only twenty make the prompt; stop scanning early
+                    if len(relevant) == 20:
+                        break
+            return json.dumps(relevant, indent=2)
+
+        elements = ui_graph.get("elements", {})
+
         for element_id, element in elements.items():
             # Check if element might be relevant based on labels/text
-            text_fields = [
-                element.get("label", ""),
-                element.get("title", ""), 
-                element.get("value", "")
-            ]
-            
-            element_text = " ".join(filter(None, text_fields)).lower()
-            
+            element_text = " ".join((
+                element.get("label") or "",
+                element.get("title") or "",
+                element.get("value") or ""
+            )).lower()
+
             # Simple keyword matching - could be improved with semantic similarity
-            if any(word in element_text for word in task_lower.split() if len(word) > 2):
+            if pattern.search(element_text):
                 relevant.append({
                     "id": element_id,
                     "role": element.get("role"),
@@ -360,10 +923,85 @@ class AgentlyPlanner:
                     "title": element.get("title"),
                     "enabled": element.get("isEnabled", False)
                 })
-        
-        # Limit to most relevant elements
-        return json.dumps(relevant[:20], indent=2)
-    
+                if len(relevant) == 20:
+                    break
+
+        return json.dumps(relevant, indent=2)
+
+    def _analyze_ui(self, ui_graph: Dict[str, Any], task: str,
+                    ui_soa: Optional[Dict[str, Any]] = None) -> tuple:
+        """Summarize the graph and find task-relevant elements in one pass.
+
+        generate_plan needs both the summary and the relevant-element
+        listing; fusing the traversals walks a large graph once instead
+        of twice. Returns (ui_summary, relevant_elements_json).
+        """
+        keywords = [word for word in task.lower().split() if len(word) > 2]
+        pattern = re.compile("|".join(map(re.escape, keywords))) if keywords else None
+
+        notable_elements = []
+        relevant = []
+
+        if ui_soa is not None:
+            active_app = ui_soa["active_application"]
+            roles = ui_soa["roles"]
+            element_count = len(roles)
+            role_counts = Counter(roles)
+            for element_id, role, label, title, enabled, text in zip(
+                ui_soa["ids"], roles, ui_soa["labels"],
+                ui_soa["titles"], ui_soa["enabled"], ui_soa["texts"]
+            ):
+                if len(notable_elements) < 10 and role in _NOTABLE_ROLES:
+                    notable_elements.append(f"{role} '{label or title or 'unlabeled'}'")
+                if pattern is not None and len(relevant) < 20 and pattern.search(text):
+                    relevant.append({
+                        "id": element_id,
+                        "role": role,
+                        "label": label,
+                        "title": title,
+                        "enabled": enabled
+                    })
+                # Role counts are already done, so the scan can stop as
+                # soon as both collections are full
+                if len(notable_elements) == 10 and (
+                    pattern is None or len(relevant) == 20
+                ):
+                    break
+        else:
+            elements = ui_graph.get("elements", {})
+            active_app = ui_graph.get("activeApplication")
+            element_count = len(elements)
+            role_counts = Counter()
+            for element_id, element in elements.items():
+                role = element.get("role", "unknown")
+                role_counts[role] += 1
+                label = element.get("label")
+                title = element.get("title")
+                if len(notable_elements) < 10 and role in _NOTABLE_ROLES:
+                    notable_elements.append(f"{role} '{label or title or 'unlabeled'}'")
+                if pattern is not None and len(relevant) < 20:
+                    element_text = " ".join((
+                        label or "", title or "", element.get("value") or ""
+                    )).lower()
+                    if pattern.search(element_text):
+                        relevant.append({
+                            "id": element_id,
+                            "role": element.get("role"),
+                            "label": label,
+                            "title": title,
+                            "enabled": element.get("isEnabled", False)
+                        })
+
+        summary = (
+            f"Application: {active_app or 'Unknown'}\\n"
+            f"Total elements: {element_count}\\n"
+            f"Element types: {dict(role_counts)}\\n"
+        )
+        if notable_elements:
+            summary += f"Key interactive elements: {notable_elements}"
+
+        return summary, json.dumps(relevant, indent=2)
+
     def _format_elements_for_selection(self, elements: List[Dict[str, Any]]) -> str:
         """Format elements for element selection prompt."""
         formatted = []
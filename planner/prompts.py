@@ -2,6 +2,7 @@
 Prompt templates for the Agently planner.
 """
 
+import string
 from dataclasses import dataclass
 from typing import Dict, Any
 
@@ -9,17 +10,29 @@ from typing import Dict, Any
 @dataclass
 class PromptTemplate:
     """Template for generating prompts."""
-    
+
     template: str
     required_variables: list[str]
-    
+
+    def __post_init__(self):
+        # Pre-parse the template once: format() then only walks the
+        # cached (literal, field) chunks and joins them, instead of
+        # re-parsing the template string (and its {{ escapes) per call
+        self._parsed = list(string.Formatter().parse(self.template))
+
     def format(self, **kwargs) -> str:
         """Format the template with provided variables."""
         for var in self.required_variables:
             if var not in kwargs:
                 raise ValueError(f"Missing required variable: {var}")
-        
-        return self.template.format(**kwargs)
+
+        parts = []
+        for literal, field, spec, _conversion in self._parsed:
+            parts.append(literal)
+            if field is not None:
+                value = kwargs[field]
+                parts.append(format(value, spec) if spec else str(value))
+        return "".join(parts)
 
 
 class SystemPrompts:
@@ -4,20 +4,79 @@ Tests for the Agently planner module.
 
 import json
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 from planner.planner import AgentlyPlanner, PlanningContext, ActionPlan
 from planner.prompts import SystemPrompts, TaskPrompts
 
 
-class TestAgentlyPlanner:
-    """Test the main planner functionality."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.planner = AgentlyPlanner(api_key="test_key")
-        
-        self.sample_ui_graph = {
+PLAN_RESPONSE_JSON = json.dumps({
+    "reasoning": "Click the submit button to complete the form",
+    "actions": [
+        {
+            "type": "click",
+            "target_element_id": "button_1",
+            "parameters": {},
+            "description": "Click submit button"
+        }
+    ],
+    "confidence": 0.9
+})
+
+# Response objects keyed by payload, built once and reused across
+# tests and repeated create() calls
+_MOCK_RESPONSES = {}
+
+
+def _cached_response(payload: str) -> SimpleNamespace:
+    """Return the shared mock response for a payload, building it once."""
+    response = _MOCK_RESPONSES.get(payload)
+    if response is None:
+        response = _MOCK_RESPONSES[payload] = SimpleNamespace(
+            model="gpt-4o-mini",
+            usage=None,
+            choices=[SimpleNamespace(
+                message=SimpleNamespace(content=payload),
+                finish_reason="stop"
+            )]
+        )
+    return response
+
+
+# Prewarm the fixed payload used by the plan-generation tests
+_cached_response(PLAN_RESPONSE_JSON)
+
+
+@pytest.fixture(scope="module")
+def mock_openai_client():
+    """Preconfigured fake OpenAI client shared across tests.
+
+    The response tree is plain SimpleNamespace objects rather than
+    nested MagicMocks: attribute access is direct and the structure is
+    fixed, so a typo fails loudly instead of auto-creating a child
+    mock. (create_autospec can't reach client.chat.completions here
+    because the real client builds those attributes in __init__.)
+    Responses come from the module-level cache, so repeated create()
+    calls hand back the same prewarmed object.
+    """
+    client = Mock()
+    client.chat.completions.create.side_effect = (
+        lambda *args, **kwargs: _cached_response(PLAN_RESPONSE_JSON)
+    )
+    return client
+
+
+@pytest.fixture(scope="module")
+def planner():
+    """One planner for the whole module: client init is paid once."""
+    return AgentlyPlanner(api_key="test_key")
+
+
+@pytest.fixture(scope="module")
+def sample_ui_graph():
+    """Shared sample UI graph; tests treat it as read-only."""
+    return {
             "elements": {
                 "button_1": {
                     "id": "button_1",
@@ -44,34 +103,38 @@ class TestAgentlyPlanner:
             "rootElements": ["button_1", "text_1"],
             "activeApplication": "TestApp"
         }
-    
-    def test_planning_context_creation(self):
+
+
+class TestAgentlyPlanner:
+    """Test the main planner functionality."""
+
+    def test_planning_context_creation(self, sample_ui_graph):
         """Test creating a planning context."""
         context = PlanningContext(
             task="Click the submit button",
-            ui_graph=self.sample_ui_graph,
+            ui_graph=sample_ui_graph,
             active_application="TestApp"
         )
-        
+
         assert context.task == "Click the submit button"
-        assert context.ui_graph == self.sample_ui_graph
+        assert context.ui_graph == sample_ui_graph
         assert context.active_application == "TestApp"
         assert context.previous_actions == []
         assert context.error_context is None
-    
-    def test_ui_graph_summarization(self):
+
+    def test_ui_graph_summarization(self, planner, sample_ui_graph):
         """Test UI graph summarization."""
-        summary = self.planner._summarize_ui_graph(self.sample_ui_graph)
-        
+        summary = planner._summarize_ui_graph(sample_ui_graph)
+
         assert "TestApp" in summary
         assert "2" in summary  # element count
         assert "AXButton" in summary
         assert "AXTextField" in summary
-    
-    def test_relevant_elements_finding(self):
+
+    def test_relevant_elements_finding(self, planner, sample_ui_graph):
         """Test finding relevant elements for a task."""
-        relevant = self.planner._find_relevant_elements(
-            self.sample_ui_graph, 
+        relevant = planner._find_relevant_elements(
+            sample_ui_graph,
             "submit the form"
         )
         
@@ -83,64 +146,51 @@ class TestAgentlyPlanner:
         submit_elements = [e for e in relevant_data if "submit" in str(e).lower()]
         assert len(submit_elements) > 0
     
-    @patch('planner.planner.OpenAI')
-    def test_generate_plan_success(self, mock_openai):
+    def test_generate_plan_success(self, monkeypatch, mock_openai_client,
+                                   planner, sample_ui_graph):
         """Test successful plan generation."""
-        # Mock OpenAI response
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = json.dumps({
-            "reasoning": "Click the submit button to complete the form",
-            "actions": [
-                {
-                    "type": "click",
-                    "target_element_id": "button_1",
-                    "parameters": {},
-                    "description": "Click submit button"
-                }
-            ],
-            "confidence": 0.9
-        })
-        
-        mock_client = Mock()
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.return_value = mock_client
-        
+        # The planner built its client in __init__, so patching the
+        # OpenAI constructor here would change nothing; swap the client
+        # on the instance (monkeypatch restores it after the test)
+        monkeypatch.setattr(planner, "client", mock_openai_client)
+
         context = PlanningContext(
             task="Submit the form",
-            ui_graph=self.sample_ui_graph
+            ui_graph=sample_ui_graph
         )
-        
-        plan = self.planner.generate_plan(context)
-        
+
+        plan = planner.generate_plan(context)
+
         assert isinstance(plan, ActionPlan)
         assert plan.confidence == 0.9
         assert len(plan.actions) == 1
         assert plan.actions[0]["type"] == "click"
         assert plan.actions[0]["target_element_id"] == "button_1"
     
-    @patch('planner.planner.OpenAI')
-    def test_generate_plan_failure(self, mock_openai):
+    def test_generate_plan_failure(self, monkeypatch, planner, sample_ui_graph):
         """Test plan generation failure handling."""
-        # Mock OpenAI to raise an exception
+        # Client whose completion call always raises, swapped onto the
+        # shared planner instance like in the success test
         mock_client = Mock()
         mock_client.chat.completions.create.side_effect = Exception("API Error")
-        mock_openai.return_value = mock_client
-        
+        monkeypatch.setattr(planner, "client", mock_client)
+
+        # Distinct task: the success test memoized its plan, and a cache
+        # hit would never reach the failing client
         context = PlanningContext(
-            task="Submit the form",
-            ui_graph=self.sample_ui_graph
+            task="Archive the report",
+            ui_graph=sample_ui_graph
         )
-        
-        plan = self.planner.generate_plan(context)
-        
+
+        plan = planner.generate_plan(context)
+
         # Should return fallback plan
         assert isinstance(plan, ActionPlan)
         assert plan.confidence == 0.0
         assert len(plan.actions) == 0
         assert "Error in planning" in plan.reasoning
     
-    def test_element_formatting(self):
+    def test_element_formatting(self, planner):
         """Test element formatting for selection."""
         elements = [
             {
@@ -151,7 +201,7 @@ class TestAgentlyPlanner:
             }
         ]
         
-        formatted = self.planner._format_elements_for_selection(elements)
+        formatted = planner._format_elements_for_selection(elements)
         formatted_data = json.loads(formatted)
         
         assert len(formatted_data) == 1
@@ -0,0 +1,70 @@
+"""
+Tests for the benchmark task loader.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from benchmark_tasks import task_loader
+from benchmark_tasks.task_loader import TaskLoader, _MMAP_THRESHOLD
+
+
+TASKS_DIR = Path(__file__).parent.parent / "benchmark_tasks"
+
+
+@pytest.fixture
+def tasks_directory(tmp_path):
+    """Temporary tasks directory with the real schema and one task."""
+    shutil.copy(TASKS_DIR / "task_schema.json", tmp_path / "task_schema.json")
+    shutil.copytree(TASKS_DIR / "app_management", tmp_path / "app_management")
+    return tmp_path
+
+
+class TestTaskLoader:
+    """Test task file loading."""
+
+    def test_load_task(self, tasks_directory):
+        """Test loading a small task file."""
+        loader = TaskLoader(tasks_directory)
+        task = loader.load_task("app_management/open_calculator.json")
+
+        assert task.task_id == "open_calculator_basic"
+        assert task.category == "app_management"
+
+    def test_load_large_task_uses_mmap(self, tasks_directory, monkeypatch):
+        """Test that files over the mmap threshold parse correctly.
+
+        The mmap branch must hand the parser a memoryview: orjson
+        rejects raw mmap objects, so passing one would fail every
+        large task file. The parser is patched to record the buffer
+        type so the branch is exercised whether or not orjson is
+        installed (the stdlib fallback never takes it).
+        """
+        task_path = tasks_directory / "app_management" / "open_calculator.json"
+        task_data = json.loads(task_path.read_bytes())
+        # Pad the description until the file clears the mmap threshold
+        task_data["description"] += " padding" * (_MMAP_THRESHOLD // 8)
+        task_path.write_text(json.dumps(task_data))
+        assert task_path.stat().st_size > _MMAP_THRESHOLD
+
+        seen_types = []
+
+        def recording_loads(buf):
+            seen_types.append(type(buf))
+            return json.loads(bytes(buf) if not isinstance(buf, str) else buf)
+
+        monkeypatch.setattr(task_loader, "orjson", object())
+        monkeypatch.setattr(task_loader, "_json_loads", recording_loads)
+
+        loader = TaskLoader(tasks_directory)
+        task = loader.load_task(task_path)
+
+        assert task.task_id == "open_calculator_basic"
+        assert memoryview in seen_types
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])